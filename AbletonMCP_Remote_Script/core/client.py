@@ -5,33 +5,496 @@ This module handles individual client connections and message processing
 for the Ableton Live Remote Script.
 """
 
+from collections import deque
 from collections.abc import Callable
 import json
+import selectors
 import socket
+import struct
 import traceback
 from typing import Any
 
 from ..utils import format_error_response
 
+# Prefer orjson when it is importable (it returns bytes directly and parses
+# considerably faster); fall back to the standard library otherwise.
+try:
+    import orjson
 
-class ClientHandler:
-    """Handles individual client connections and message processing."""
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    # One encoder for every response, producing compact output like orjson
+    _ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _ENCODER.encode(obj).encode("utf-8")
+
+
+# Delivers a response that is produced later, e.g. on Live's main thread.
+# May be called from any thread.
+Reply = Callable[[dict[str, Any] | bytes], None]
+# Returns the response, or None if it will be delivered through the reply
+CommandProcessor = Callable[[dict[str, Any], Reply], dict[str, Any] | bytes | None]
+
+
+def encode_response(response: dict[str, Any]) -> bytes:
+    """
+    Encode a response dictionary into the bytes sent on the wire.
+
+    Responses that never change can be encoded once with this and handed
+    back from a command processor in place of the dictionary.
+
+    Args:
+        response: The response dictionary
+
+    Returns:
+        bytes: The UTF-8 JSON payload (without a frame header)
+    """
+    return _json_dumps(response)
+
+
+# Length prefix used by the framed protocol: 4-byte big-endian payload size
+FRAME_HEADER = struct.Struct("!I")
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+_LEGACY_FRAME_START = ord("{")
+_LEGACY_FRAME_END = ord("}")
+_JSON_WHITESPACE = b" \t\r\n"
+_JSON_WHITESPACE_CHARS = " \t\r\n"
+_RAW_DECODER = json.JSONDecoder()
+RECV_BUFFER_SIZE = 64 * 1024
+SOCKET_BUFFER_SIZE = 256 * 1024
+
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+_AF_UNIX = getattr(socket, "AF_UNIX", None)  # Not available on Windows
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")  # Not available on Windows
+
+
+def _ends_with_brace(buffer: bytearray, end: int) -> bool:
+    """
+    Check whether the last non-whitespace byte of a buffer is a closing brace.
+
+    Args:
+        buffer: The receive buffer
+        end: Number of valid bytes at the start of the buffer
+
+    Returns:
+        bool: True if the buffer could hold a complete JSON object
+    """
+    index = end - 1
+    while index >= 0 and buffer[index] in _JSON_WHITESPACE:
+        index -= 1
+    return index >= 0 and buffer[index] == _LEGACY_FRAME_END
+
+
+def _split_json_objects(data: bytearray) -> tuple[list[Any], int]:
+    """
+    Decode the complete JSON objects at the start of a buffer.
+
+    Each object is decoded once with ``raw_decode``, which reports where it
+    ended, so pipelined unframed commands can be split without re-parsing.
+
+    Args:
+        data: The buffered bytes
+
+    Returns:
+        tuple: The decoded objects and the number of bytes they used
+    """
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return [], 0
+
+    objects = []
+    index = consumed = 0
+    length = len(text)
+    while True:
+        while index < length and text[index] in _JSON_WHITESPACE_CHARS:
+            index += 1
+        if index == length:
+            consumed = index
+            break
+        try:
+            obj, index = _RAW_DECODER.raw_decode(text, index)
+        except ValueError:
+            break
+        objects.append(obj)
+        consumed = index
+
+    return objects, len(text[:consumed].encode("utf-8"))
+
+
+class _ClientConnection:
+    """
+    Receive state of one client served from the selector thread.
+
+    The server calls ``on_readable`` whenever the socket has data. Each call
+    does a single ``recv_into`` into a reusable buffer, so it never blocks,
+    and then processes every complete command received so far; a partial
+    command simply waits for the next call.
+
+    Commands that run on Live's main thread are answered later, through the
+    server's ``call_soon``, so the selector thread never waits for them.
+    Replies must still go out in request order, so commands received while
+    one is outstanding are queued until its reply has been sent.
+
+    Replies are written without blocking. Whatever the socket can't take
+    right away is kept in an output buffer and flushed once the selector
+    reports the socket writable; until then nothing more is read from the
+    client, so a client that stops reading only holds up itself.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_call_soon",
+        "_end",
+        "_framed",
+        "_handler",
+        "_large",
+        "_large_received",
+        "_out",
+        "_queue",
+        "_reply_framed",
+        "_set_writing",
+        "_sock",
+        "_start",
+    )
 
     def __init__(
         self,
-        logger: Any,
-        command_processor: Callable[[dict[str, Any]], dict[str, Any]],
-    ):
+        handler: "ClientHandler",
+        sock: socket.socket,
+        call_soon: Callable[[Callable[[], None]], None],
+        set_writing: Callable[[bool], None],
+        size: int = RECV_BUFFER_SIZE,
+    ) -> None:
+        """
+        Initialize the connection state.
+
+        Args:
+            handler: The client handler that processes commands
+            sock: The client socket
+            call_soon: Runs a callback on the selector thread, from any thread
+            set_writing: Tells the selector whether to wait for the socket to
+                become writable (True) or readable (False)
+            size: Initial buffer capacity in bytes
+        """
+        self._handler = handler
+        self._sock = sock
+        self._call_soon = call_soon
+        self._set_writing = set_writing
+        # Encoded replies the socket hasn't taken yet
+        self._out = bytearray()
+        # Commands (dicts) and ready replies (bytes) waiting to be handled in
+        # order, each with whether its reply needs a length prefix
+        self._queue: deque[tuple[dict[str, Any] | bytes, bool]] = deque()
+        # How the outstanding reply must be framed, or None if there is none
+        self._reply_framed: bool | None = None
+        self._buffer = bytearray(size)
+        self._start = 0
+        self._end = 0
+        # Unknown until the first byte arrives
+        self._framed: bool | None = None
+        # Frames larger than the buffer are received into their own bytearray
+        self._large: bytearray | None = None
+        self._large_received = 0
+
+    def on_ready(self, events: int) -> bool:
+        """
+        Flush pending replies and/or receive data, as the selector reports.
+
+        Args:
+            events: The selectors event mask the socket is ready for
+
+        Returns:
+            bool: False once the connection should be closed
+        """
+        if events & selectors.EVENT_WRITE and not self._flush():
+            return False
+        if events & selectors.EVENT_READ:
+            return self.on_readable()
+        return self._handler.running
+
+    def on_readable(self) -> bool:
+        """
+        Receive available data and process any complete commands.
+
+        Returns:
+            bool: False once the connection should be closed
+        """
+        try:
+            if self._large is not None:
+                received = self._receive_large()
+            else:
+                received = self._receive()
+                if received:
+                    if self._framed is None:
+                        # The first byte tells the two wire formats apart: a
+                        # frame header is a big-endian length, while older MCP
+                        # servers send a bare JSON object starting with "{".
+                        self._framed = self._buffer[0] != _LEGACY_FRAME_START
+                    if self._framed:
+                        self._process_frames()
+                    else:
+                        self._process_legacy()
+        except BlockingIOError:
+            # Spurious wakeup; nothing to read after all
+            return self._handler.running
+        except OSError as e:
+            # An error reply can't be slipped in between buffered replies
+            if not self._out:
+                self._handler._report_error(self._sock, e, self._framed is not False)
+            return False
+
+        if not received:
+            self._handler.logger.log_message("Client disconnected")
+            return False
+        return self._handler.running
+
+    def _receive(self) -> bool:
+        """
+        Receive into the shared buffer with a single ``recv_into`` call.
+
+        Returns:
+            bool: False if the peer closed the connection
+        """
+        buffer = self._buffer
+        if self._start:
+            # Move unread bytes to the front to make room
+            pending = self._end - self._start
+            buffer[:pending] = buffer[self._start : self._end]
+            self._start, self._end = 0, pending
+        if self._end == len(buffer):
+            # Only unframed commands can fill the whole buffer
+            buffer.extend(bytes(len(buffer)))
+
+        count = self._sock.recv_into(memoryview(buffer)[self._end :])
+        if not count:
+            return False
+        self._end += count
+        return True
+
+    def _receive_large(self) -> bool:
+        """
+        Receive the rest of an oversized frame straight into its own bytearray.
+
+        Big note batches are received in place instead of growing the shared
+        buffer, so each byte is copied at most once and the connection does
+        not keep the peak allocation alive after the frame is parsed.
+
+        Returns:
+            bool: False if the peer closed the connection
+        """
+        large = self._large
+        count = self._sock.recv_into(memoryview(large)[self._large_received :])
+        if not count:
+            return False
+        self._large_received += count
+        if self._large_received == len(large):
+            self._large = None
+            self._dispatch(large)
+        return True
+
+    def _process_frames(self) -> None:
+        """Process every complete length-prefixed frame in the buffer."""
+        buffer = self._buffer
+        unpack_from = FRAME_HEADER.unpack_from
+        header_size = FRAME_HEADER.size
+        start, end = self._start, self._end
+
+        while end - start >= header_size:
+            (length,) = unpack_from(buffer, start)
+            if length > MAX_FRAME_SIZE:
+                raise OSError(f"Frame of {length} bytes exceeds limit")
+
+            payload_start = start + header_size
+            if header_size + length > len(buffer):
+                # Hand what we have so far over to a dedicated buffer
+                large = bytearray(length)
+                received = end - payload_start
+                large[:received] = memoryview(buffer)[payload_start:end]
+                self._large, self._large_received = large, received
+                start = end = 0
+                break
+            if end - payload_start < length:
+                break
+
+            start = payload_start + length
+            if not length:
+                # An empty frame is a liveness ping, answered in kind (an empty
+                # payload) without any JSON work
+                self._submit(b"", True)
+                continue
+            # Slice through a memoryview so the payload is copied only once
+            self._dispatch(bytes(memoryview(buffer)[payload_start:start]))
+
+        self._start, self._end = start, end
+
+    def _process_legacy(self) -> None:
+        """Process the buffered unframed command once it is complete."""
+        buffer = self._buffer
+        end = self._end
+
+        # A complete command always ends with "}", so only attempt a parse
+        # when the buffered data does. Retrying after every chunk would
+        # re-parse large payloads over and over.
+        if not _ends_with_brace(buffer, end):
+            return
+        data = buffer[:end]
+        try:
+            commands = [_json_loads(data)]
+            consumed = end
+        except ValueError:
+            # Either incomplete data or several commands sent back to back
+            # (orjson.JSONDecodeError and UnicodeDecodeError are both
+            # ValueError subclasses)
+            commands, consumed = _split_json_objects(data)
+            if not commands:
+                return
+
+        # Keep any incomplete command that follows the parsed ones
+        remaining = end - consumed
+        buffer[:remaining] = buffer[consumed:end]
+        self._end = remaining
+        for command in commands:
+            self._submit(command, False)
+
+    def _dispatch(self, payload: bytes | bytearray) -> None:
+        """
+        Parse a complete frame payload and process the command.
+
+        Args:
+            payload: The JSON payload of one frame
+        """
+        try:
+            command = _json_loads(payload)
+        except ValueError as e:
+            # The frame is complete, so this is a malformed command
+            self._submit(encode_response(format_error_response(f"Invalid JSON: {str(e)}")), True)
+        else:
+            self._submit(command, True)
+
+    def _submit(self, item: dict[str, Any] | bytes, framed: bool) -> None:
+        """
+        Queue a command or a ready reply, and handle it unless a reply is
+        still outstanding.
+
+        Args:
+            item: A parsed command, or the encoded reply to send as is
+            framed: Whether the reply needs a length prefix
+        """
+        self._queue.append((item, framed))
+        if self._reply_framed is None:
+            self._run_queue()
+
+    def _run_queue(self) -> None:
+        """Handle queued items until one has to wait for the main thread."""
+        queue = self._queue
+        while queue and self._reply_framed is None:
+            item, framed = queue.popleft()
+            if type(item) is not bytes:
+                item = self._handler._process(item, self._reply_later)
+                if item is None:
+                    self._reply_framed = framed
+                    return
+            self._send(item, framed)
+
+    def _send(self, response: dict[str, Any] | bytes, framed: bool) -> None:
+        """
+        Send a reply without blocking, buffering whatever the socket can't take.
+
+        Args:
+            response: The response dictionary, or an already encoded payload
+            framed: Whether the reply needs a length prefix
+
+        Raises:
+            OSError: If the connection failed
+        """
+        if self._out:
+            # Earlier replies are still waiting for the socket; keep the order
+            for data in self._handler._frame(response, framed):
+                self._out += data
+            return
+        unsent = self._handler._send_response(self._sock, response, framed)
+        if unsent:
+            self._out += unsent
+            self._set_writing(True)
+
+    def _flush(self) -> bool:
+        """
+        Send buffered replies now that the socket is writable.
+
+        Returns:
+            bool: False if the connection failed
+        """
+        try:
+            sent = self._sock.send(self._out)
+        except BlockingIOError:
+            return True
+        except OSError as e:
+            self._handler.logger.log_message(f"Error sending reply: {str(e)}")
+            return False
+        del self._out[:sent]
+        if not self._out:
+            # Everything went out, so go back to reading commands
+            self._set_writing(False)
+        return True
+
+    def _reply_later(self, response: dict[str, Any] | bytes) -> None:
+        """
+        Deliver the outstanding reply. Safe to call from any thread.
+
+        Args:
+            response: The response dictionary, or an already encoded payload
+        """
+        self._call_soon(lambda: self._finish_reply(response))
+
+    def _finish_reply(self, response: dict[str, Any] | bytes) -> None:
+        """
+        Send the outstanding reply and carry on with queued commands.
+        Runs on the selector thread.
+
+        Args:
+            response: The response dictionary, or an already encoded payload
+        """
+        framed, self._reply_framed = self._reply_framed, None
+        if self._sock.fileno() == -1:
+            # The client went away while the command ran
+            return
+        try:
+            self._send(response, framed)
+            self._run_queue()
+        except OSError as e:
+            self._handler.logger.log_message(f"Error sending reply: {str(e)}")
+            # Let the selector see the connection end so the server closes it
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class ClientHandler:
+    """Handles individual client connections and message processing."""
+
+    __slots__ = ("command_processor", "logger", "running", "verbose")
+
+    def __init__(self, logger: Any, command_processor: CommandProcessor):
         """
         Initialize the client handler.
 
         Args:
             logger: Logger instance for logging messages
-            command_processor: Function to process commands and return responses
+            command_processor: Function to process a command and return its
+                response, or return None and hand the response to the reply
+                callback once it is ready
         """
         self.logger = logger
         self.command_processor = command_processor
         self.running = False
+        # Per-command logs and tracebacks are only formatted when enabled
+        self.verbose = False
 
     def set_running(self, running: bool) -> None:
         """
@@ -42,92 +505,151 @@ class ClientHandler:
         """
         self.running = running
 
-    def handle_client(self, client: socket.socket) -> None:
+    def handle_client(
+        self,
+        client: socket.socket,
+        call_soon: Callable[[Callable[[], None]], None],
+        set_writing: Callable[[bool], None],
+    ) -> Callable[[int], bool]:
         """
-        Handle communication with a connected client.
+        Prepare a newly accepted client connection.
 
         Args:
             client: The client socket to handle
+            call_soon: Runs a callback on the server's selector thread, used
+                to send replies produced on Live's main thread
+            set_writing: Switches the selector between waiting for the client
+                socket to be writable (True) or readable (False)
+
+        Returns:
+            Callback for the server to run with the selectors event mask
+            whenever the client socket is ready; it returns False once the
+            connection should be closed
         """
-        self.logger.log_message("Client handler started")
-        client.settimeout(None)  # No timeout for client socket
-        buffer = ""  # String buffer for Python 2/3 compatibility
+        # Every client is served from the one selector thread, so nothing
+        # may block on a single client
+        client.setblocking(False)
 
-        try:
-            while self.running:
-                try:
-                    # Receive data
-                    data = client.recv(8192)
-
-                    if not data:
-                        # Client disconnected
-                        self.logger.log_message("Client disconnected")
-                        break
-
-                    # Handle encoding differences between Python 2 and 3
-                    try:
-                        # Python 3: data is bytes, decode to string
-                        buffer += data.decode("utf-8")
-                    except (AttributeError, UnicodeDecodeError):
-                        # Python 2: data is already string or decode failed
-                        buffer += str(data)
-
-                    try:
-                        # Try to parse command from buffer
-                        command = json.loads(buffer)
-                        buffer = ""  # Clear buffer after successful parse
-
-                        command_type = command.get("type", "unknown")
-                        msg = f"Received command: {command_type}"
-                        self.logger.log_message(msg)
-
-                        # Process the command and get response
-                        response = self.command_processor(command)
-
-                        # Send the response with explicit encoding
-                        self._send_response(client, response)
-                    except ValueError:
-                        # Incomplete data, wait for more
-                        continue
-
-                except OSError as e:
-                    error_msg = f"Error handling client data: {str(e)}"
-                    self.logger.log_message(error_msg)
-                    self.logger.log_message(traceback.format_exc())
-
-                    # Send error response if possible
-                    error_response = format_error_response(str(e))
-                    try:
-                        self._send_response(client, error_response)
-                    except OSError:
-                        # If we can't send the error, connection is dead
-                        break
-                    break
-        except OSError as e:
-            self.logger.log_message(f"Error in client handler: {str(e)}")
-        finally:
+        # Small request/response frames: disable Nagle so replies are not
+        # held back waiting for an ACK (Unix domain sockets have no Nagle)
+        if client.family != _AF_UNIX:
             try:
-                client.close()
-            except OSError:
-                pass
-            self.logger.log_message("Client handler stopped")
+                client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError as e:
+                self.logger.log_message(f"Could not set TCP_NODELAY: {str(e)}")
 
-    def _send_response(self, client: socket.socket, response: dict[str, Any]) -> None:
+        # Kernel buffers large enough for big note or browser payloads
+        for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+            try:
+                client.setsockopt(socket.SOL_SOCKET, option, SOCKET_BUFFER_SIZE)
+            except OSError as e:
+                self.logger.log_message(f"Could not set socket buffer size: {str(e)}")
+
+        return _ClientConnection(self, client, call_soon, set_writing).on_ready
+
+    def _process(self, command: dict[str, Any], reply: Reply) -> dict[str, Any] | bytes | None:
+        """
+        Process a parsed command.
+
+        Args:
+            command: The parsed command dictionary
+            reply: Receives the response later if it isn't returned
+
+        Returns:
+            The response, or None if it will be delivered through reply
+        """
+        if self.verbose:
+            self.logger.log_message(f"Received command: {command.get('type', 'unknown')}")
+
+        return self.command_processor(command, reply)
+
+    def _report_error(self, client: socket.socket, error: OSError, framed: bool) -> None:
+        """
+        Log a socket error and try to tell the client about it.
+
+        Args:
+            client: The client socket
+            error: The error that occurred
+            framed: Whether the reply needs a length prefix
+        """
+        self.logger.log_message(f"Error handling client data: {str(error)}")
+        if self.verbose:
+            self.logger.log_message(traceback.format_exc())
+
+        # Send error response if possible; if that fails too, or the socket
+        # can't take it right away, the caller closes the connection anyway
+        try:
+            self._send_response(client, format_error_response(str(error)), framed)
+        except OSError:
+            pass
+
+    def _encode(self, response: dict[str, Any]) -> bytes:
+        """
+        Encode a response, or an error response if it can't be encoded.
+
+        A response that fails to encode still gets an answer, so the client
+        isn't left waiting and the commands queued behind it carry on.
+
+        Args:
+            response: The response dictionary
+
+        Returns:
+            bytes: The UTF-8 JSON payload
+        """
+        try:
+            return _json_dumps(response)
+        except Exception as e:
+            # TypeError/ValueError from json, orjson.JSONEncodeError
+            self.logger.log_message(f"Error encoding response: {str(e)}")
+            return _json_dumps(format_error_response(f"Could not encode response: {str(e)}"))
+
+    def _frame(self, response: dict[str, Any] | bytes, framed: bool) -> list[bytes]:
+        """
+        Encode a response into the buffers that go on the wire.
+
+        Args:
+            response: The response dictionary, or an already encoded payload
+            framed: Whether to prefix the payload with its length
+
+        Returns:
+            list: The frame header (if framed) and the payload
+        """
+        payload = response if type(response) is bytes else self._encode(response)
+        return [FRAME_HEADER.pack(len(payload)), payload] if framed else [payload]
+
+    def _send_response(self, client: socket.socket, response: dict[str, Any] | bytes, framed: bool = True) -> bytes:
         """
-        Send a JSON response to the client.
+        Send a JSON response to the client without blocking.
+
+        Header and payload go out in a single call so the kernel can emit
+        them as one segment.
 
         Args:
-            client: The client socket to send to
-            response: The response dictionary to send
+            client: The non-blocking client socket to send to
+            response: The response dictionary, or an already encoded payload
+            framed: Whether to prefix the payload with its length
+
+        Returns:
+            bytes: The part of the reply the socket couldn't take yet, empty
+            if it was all sent
 
         Raises:
             OSError: If there's an error sending the response
         """
-        response_data = json.dumps(response)
-        # Handle encoding differences between Python 2 and 3
-        if hasattr(response_data, "encode"):
-            # Python 3: encode string to bytes
-            client.sendall(response_data.encode("utf-8"))
-        else:
-            # Python 2: string is already bytes-like
-            client.sendall(response_data)
+        buffers = self._frame(response, framed)
+        try:
+            sent = client.sendmsg(buffers) if _HAS_SENDMSG else client.send(b"".join(buffers))
+        except BlockingIOError:
+            sent = 0
+
+        # Linux only: acknowledge immediately so delayed ACKs don't pair up
+        # with Nagle on the peer side (the option resets after each use)
+        if _TCP_QUICKACK is not None and client.family != _AF_UNIX:
+            try:
+                client.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+            except OSError:
+                pass
+
+        if sent == sum(map(len, buffers)):
+            return b""
+        return b"".join(buffers)[sent:]
@@ -5,15 +5,12 @@ This module contains the main AbletonMCP class that coordinates between
 the socket server, client handler, and Ableton Live handlers.
 """
 
+from collections import deque
+from collections.abc import Callable
+import os
 import traceback
 from typing import Any
 
-# Change queue import for Python 2
-try:
-    import Queue as queue  # Python 2
-except ImportError:
-    import queue  # Python 3
-
 from _Framework.ControlSurface import ControlSurface
 
 # Import handlers
@@ -24,9 +21,45 @@ from ..handlers.session_handlers import SessionHandlers
 from ..utils import format_error_response, format_success_response
 
 # Import core components
-from .client import ClientHandler
+from .client import ClientHandler, Reply, encode_response
 from .server import DEFAULT_PORT, SocketServer
 
+# Handler entry point: takes positional arguments, returns the result payload
+CommandHandler = Callable[..., Any]
+ParamSchema = Callable[[dict[str, Any]], tuple[Any, ...]]
+
+
+def _no_params(params: dict[str, Any]) -> tuple[Any, ...]:
+    """Schema for commands without parameters."""
+    return ()
+
+
+# Per-command argument extraction: each schema pulls the handler's
+# positional arguments (with their defaults) out of the params dict in one go
+_PARAM_SCHEMAS: dict[str, ParamSchema] = {
+    "set_debug": lambda p: (p.get("enabled", True),),
+    "ping": _no_params,
+    "get_session_info": _no_params,
+    "get_track_info": lambda p: (p.get("track_index", 0),),
+    "get_browser_item": lambda p: (p.get("uri"), p.get("path")),
+    "get_browser_tree": lambda p: (p.get("category_type", "all"), p.get("depth", 0)),
+    "get_browser_items_at_path": lambda p: (p.get("path", ""),),
+    "invalidate_browser_index": _no_params,
+    "create_midi_track": lambda p: (p.get("index", -1),),
+    "set_track_name": lambda p: (p.get("track_index", 0), p.get("name", "")),
+    "create_clip": lambda p: (p.get("track_index", 0), p.get("clip_index", 0), p.get("length", 4.0)),
+    "add_notes_to_clip": lambda p: (p.get("track_index", 0), p.get("clip_index", 0), p.get("notes", [])),
+    "set_clip_name": lambda p: (p.get("track_index", 0), p.get("clip_index", 0), p.get("name", "")),
+    "set_tempo": lambda p: (p.get("tempo", 120.0),),
+    "fire_clip": lambda p: (p.get("track_index", 0), p.get("clip_index", 0)),
+    "stop_clip": lambda p: (p.get("track_index", 0), p.get("clip_index", 0)),
+    "start_playback": _no_params,
+    "stop_playback": _no_params,
+    "load_browser_item": lambda p: (p.get("track_index", 0), p.get("item_uri", "")),
+    "load_drum_kit": lambda p: (p.get("track_index", 0), p.get("rack_uri", ""), p.get("kit_path", "")),
+    "batch": lambda p: (p.get("ops", []), p.get("continue_on_error", True)),
+}
+
 
 class AbletonMCP(ControlSurface):
     """AbletonMCP Remote Script for Ableton Live."""
@@ -39,14 +72,79 @@ class AbletonMCP(ControlSurface):
         # Cache the song reference for easier access
         self._song = self.song()
 
+        # Full tracebacks and per-command logs are only produced in debug mode
+        self._debug = os.environ.get("ABLETON_MCP_DEBUG", "") not in ("", "0")
+
         # Initialize handlers
         self.session_handlers = SessionHandlers(self)
         self.clip_handlers = ClipHandlers(self)
         self.playback_handlers = PlaybackHandlers(self)
         self.browser_handlers = BrowserHandlers(self)
 
+        # Command dispatch tables, built once so routing is a dict lookup
+        # straight to the bound handler method. Arguments are extracted by
+        # the per-command schemas in _PARAM_SCHEMAS.
+        session = self.session_handlers
+        clip = self.clip_handlers
+        playback = self.playback_handlers
+        browser = self.browser_handlers
+
+        # Commands that don't modify Live's state run on the client thread.
+        self._readonly_cmds: dict[str, CommandHandler] = {
+            "set_debug": self._set_debug,
+            "ping": self._ping,
+            "get_session_info": session.get_session_info,
+            "get_track_info": session.get_track_info,
+            "get_browser_item": browser.get_browser_item,
+            "get_browser_tree": browser.get_browser_tree,
+            "get_browser_items_at_path": browser.get_browser_items_at_path,
+            "invalidate_browser_index": browser.invalidate_browser_index,
+        }
+        # Commands that modify Live's state must run on the main thread
+        self._main_thread_cmds: dict[str, CommandHandler] = {
+            "create_midi_track": session.create_midi_track,
+            "set_track_name": session.set_track_name,
+            "create_clip": clip.create_clip,
+            "add_notes_to_clip": clip.add_notes_to_clip,
+            "set_clip_name": clip.set_clip_name,
+            "set_tempo": session.set_tempo,
+            "fire_clip": clip.fire_clip,
+            "stop_clip": clip.stop_clip,
+            "start_playback": self._start_playback,
+            "stop_playback": self._stop_playback,
+            "load_browser_item": browser.load_browser_item,
+            "load_drum_kit": browser.load_drum_kit,
+            "batch": self._run_batch,
+        }
+        # Commands allowed inside a batch. Everything in a batch runs on the
+        # main thread, and playback toggles return plain results there
+        # instead of pre-encoded responses.
+        self._batch_cmds: dict[str, CommandHandler] = {
+            **self._readonly_cmds,
+            **self._main_thread_cmds,
+            "start_playback": playback.start_playback,
+            "stop_playback": playback.stop_playback,
+        }
+        del self._batch_cmds["batch"]
+
+        # Playback toggles can only answer one of two ways, so encode both
+        # responses once instead of serializing them per command
+        self._playing_responses = {
+            state: encode_response(format_success_response({"playing": state})) for state in (True, False)
+        }
+
+        # Main-thread tasks waiting to run. Tasks queued before the scheduled
+        # drain fires share a single schedule_message callback. deque append
+        # and popleft are atomic, so the handoff needs no lock.
+        self._pending: deque[Callable[[], None]] = deque()
+        self._batch_scheduled = False
+        # Set once Live calls update_display, which then drains the queue on
+        # every tick so no schedule_message hop is needed
+        self._tick_drain = False
+
         # Initialize client handler
         self.client_handler = ClientHandler(self, self._process_command)
+        self.client_handler.verbose = self._debug
 
         # Initialize and start socket server
         self.server = SocketServer(self, self.show_message)
@@ -72,147 +170,169 @@ class AbletonMCP(ControlSurface):
         # Stop the server
         self.server.stop()
 
+        self.session_handlers.disconnect()
+        self.clip_handlers.disconnect()
+
         ControlSurface.disconnect(self)
         self.log_message("AbletonMCP disconnected")
 
-    def _process_command(self, command: dict[str, Any]) -> dict[str, Any]:
+    def update_display(self) -> None:
+        """Called by Live on every display tick; runs queued main-thread tasks."""
+        ControlSurface.update_display(self)
+        self._tick_drain = True
+        if self._pending:
+            self._drain_batch()
+
+    def _set_debug(self, enabled: bool) -> dict[str, Any]:
+        """
+        Enable or disable debug logging.
+
+        Args:
+            enabled: Whether tracebacks and received commands should be logged
+
+        Returns:
+            dict: The new debug state
+        """
+        self._debug = bool(enabled)
+        self.client_handler.verbose = self._debug
+        self.log_message(f"Debug logging {'enabled' if self._debug else 'disabled'}")
+        return {"debug": self._debug}
+
+    def _ping(self) -> dict[str, Any]:
+        """Answer a connection check without touching Live."""
+        return {}
+
+    def _start_playback(self) -> bytes:
+        """Start playback and return the pre-encoded response."""
+        result = self.playback_handlers.start_playback()
+        return self._playing_responses[bool(result["playing"])]
+
+    def _stop_playback(self) -> bytes:
+        """Stop playback and return the pre-encoded response."""
+        result = self.playback_handlers.stop_playback()
+        return self._playing_responses[bool(result["playing"])]
+
+    def _run_batch(self, ops: list[dict[str, Any]], continue_on_error: bool) -> list[dict[str, Any]]:
+        """
+        Run several commands back-to-back in one main-thread task.
+
+        Args:
+            ops: Commands, each a dictionary with type and params
+            continue_on_error: Whether to run the remaining commands after one fails
+
+        Returns:
+            list: One response per command that was run, with status and
+            result/error
+        """
+        results = []
+        for op in ops:
+            command_type = op.get("type", "")
+            handler = self._batch_cmds.get(command_type)
+            if handler is None:
+                results.append(format_error_response(f"Unknown command: {command_type}"))
+            else:
+                try:
+                    args = _PARAM_SCHEMAS[command_type](op.get("params", {}))
+                    results.append(format_success_response(handler(*args)))
+                except Exception as e:
+                    # Report the failure for this command only
+                    self.log_message(f"Error in batch command {command_type}: {e}")
+                    if self._debug:
+                        self.log_message(traceback.format_exc())
+                    results.append(format_error_response(str(e)))
+            if not continue_on_error and results[-1]["status"] == "error":
+                break
+        return results
+
+    def _process_command(self, command: dict[str, Any], reply: Reply) -> dict[str, Any] | bytes | None:
         """
         Process a command from the client and return a response.
 
         Args:
             command: Command dictionary containing type and params
+            reply: Receives the response of a main-thread command once Live
+                has run it
 
         Returns:
-            dict: Response dictionary with status and result/error
+            Response dictionary with status and result/error, an already
+            encoded response payload, or None if the response is delivered
+            through reply
         """
         command_type = command.get("type", "")
         params = command.get("params", {})
 
         try:
             # Route the command to the appropriate handler
-            if command_type == "get_session_info":
-                result = self.session_handlers.get_session_info()
-                return format_success_response(result)
-            elif command_type == "get_track_info":
-                track_index = params.get("track_index", 0)
-                result = self.session_handlers.get_track_info(track_index)
-                return format_success_response(result)
-            # Commands that modify Live's state should be scheduled on
-            # main thread
-            elif command_type in [
-                "create_midi_track",
-                "set_track_name",
-                "create_clip",
-                "add_notes_to_clip",
-                "set_clip_name",
-                "set_tempo",
-                "fire_clip",
-                "stop_clip",
-                "start_playback",
-                "stop_playback",
-                "load_browser_item",
-            ]:
-                return self._handle_main_thread_command(command_type, params)
-            elif command_type == "get_browser_item":
-                uri = params.get("uri", None)
-                path = params.get("path", None)
-                result = self.browser_handlers.get_browser_item(uri, path)
-                return format_success_response(result)
-            elif command_type == "get_browser_tree":
-                category_type = params.get("category_type", "all")
-                result = self.browser_handlers.get_browser_tree(category_type)
-                return format_success_response(result)
-            elif command_type == "get_browser_items_at_path":
-                path = params.get("path", "")
-                result = self.browser_handlers.get_browser_items_at_path(path)
-                return format_success_response(result)
-            else:
-                error_msg = f"Unknown command: {command_type}"
-                return format_error_response(error_msg)
-        except (OSError, AttributeError, ValueError, TypeError) as e:
+            handler = self._readonly_cmds.get(command_type)
+            if handler is not None:
+                return format_success_response(handler(*_PARAM_SCHEMAS[command_type](params)))
+            if command_type in self._main_thread_cmds:
+                self._handle_main_thread_command(command_type, params, reply)
+                return None
+            error_msg = f"Unknown command: {command_type}"
+            return format_error_response(error_msg)
+        except Exception as e:
             self.log_message(f"Error processing command: {str(e)}")
-            self.log_message(traceback.format_exc())
+            if self._debug:
+                self.log_message(traceback.format_exc())
             return format_error_response(str(e))
 
-    def _handle_main_thread_command(self, command_type: str, params: dict[str, Any]) -> dict[str, Any]:
+    def _handle_main_thread_command(self, command_type: str, params: dict[str, Any], reply: Reply) -> None:
         """
-        Handle commands that need to run on the main thread.
+        Queue a command that needs to run on the main thread.
+
+        The calling (server) thread doesn't wait for it: the task hands its
+        response to reply, which sends it from the server thread.
 
         Args:
             command_type: Type of command to execute
             params: Command parameters
-
-        Returns:
-            dict: Response dictionary with status and result/error
+            reply: Receives the response dictionary, or an already encoded
+                response payload
         """
-        # Use a thread-safe approach with a response queue
-        response_queue = queue.Queue()
+        # Extract the arguments here so the main thread only runs the handler
+        handler = self._main_thread_cmds[command_type]
+        args = _PARAM_SCHEMAS[command_type](params)
 
         # Define a function to execute on the main thread
         def main_thread_task() -> None:
             try:
-                result = None
-                if command_type == "create_midi_track":
-                    index = params.get("index", -1)
-                    result = self.session_handlers.create_midi_track(index)
-                elif command_type == "set_track_name":
-                    track_idx = params.get("track_index", 0)
-                    name = params.get("name", "")
-                    result = self.session_handlers.set_track_name(track_idx, name)
-                elif command_type == "create_clip":
-                    track_idx = params.get("track_index", 0)
-                    clip_idx = params.get("clip_index", 0)
-                    length = params.get("length", 4.0)
-                    result = self.clip_handlers.create_clip(track_idx, clip_idx, length)
-                elif command_type == "add_notes_to_clip":
-                    track_idx = params.get("track_index", 0)
-                    clip_idx = params.get("clip_index", 0)
-                    notes = params.get("notes", [])
-                    result = self.clip_handlers.add_notes_to_clip(track_idx, clip_idx, notes)
-                elif command_type == "set_clip_name":
-                    track_idx = params.get("track_index", 0)
-                    clip_idx = params.get("clip_index", 0)
-                    name = params.get("name", "")
-                    result = self.clip_handlers.set_clip_name(track_idx, clip_idx, name)
-                elif command_type == "set_tempo":
-                    tempo = params.get("tempo", 120.0)
-                    result = self.session_handlers.set_tempo(tempo)
-                elif command_type == "fire_clip":
-                    track_idx = params.get("track_index", 0)
-                    clip_idx = params.get("clip_index", 0)
-                    result = self.clip_handlers.fire_clip(track_idx, clip_idx)
-                elif command_type == "stop_clip":
-                    track_idx = params.get("track_index", 0)
-                    clip_idx = params.get("clip_index", 0)
-                    result = self.clip_handlers.stop_clip(track_idx, clip_idx)
-                elif command_type == "start_playback":
-                    result = self.playback_handlers.start_playback()
-                elif command_type == "stop_playback":
-                    result = self.playback_handlers.stop_playback()
-                elif command_type == "load_browser_item":
-                    track_idx = params.get("track_index", 0)
-                    item_uri = params.get("item_uri", "")
-                    result = self.browser_handlers.load_browser_item(track_idx, item_uri)
-
-                # Put the result in the queue
-                response_queue.put(format_success_response(result))
-            except (OSError, AttributeError, ValueError, TypeError) as e:
+                result = handler(*args)
+                # Pre-encoded responses go straight to the socket
+                response = result if type(result) is bytes else format_success_response(result)
+            except Exception as e:
                 error_msg = f"Error in main thread task: {str(e)}"
                 self.log_message(error_msg)
-                self.log_message(traceback.format_exc())
-                response_queue.put(format_error_response(str(e)))
+                if self._debug:
+                    self.log_message(traceback.format_exc())
+                response = format_error_response(str(e))
+            reply(response)
 
-        # Schedule the task to run on the main thread
-        try:
-            self.schedule_message(0, main_thread_task)
-        except AssertionError:
-            # If we're already on the main thread, execute directly
-            main_thread_task()
+        # Queue the task. The display tick picks it up once Live has been
+        # seen calling update_display; until then schedule a drain unless
+        # one is already pending.
+        self._pending.append(main_thread_task)
+        if not self._tick_drain and not self._batch_scheduled:
+            # If the main thread's drain resets the flag just after this
+            # check, the extra drain just finds the queue empty
+            self._batch_scheduled = True
+            try:
+                self.schedule_message(0, self._drain_batch)
+            except AssertionError:
+                # If we're already on the main thread, execute directly
+                self._drain_batch()
 
-        # Wait for the response with a timeout
-        try:
-            task_response = response_queue.get(timeout=10.0)
-            return task_response
-        except queue.Empty:
-            error_msg = "Timeout waiting for operation to complete"
-            return format_error_response(error_msg)
+    def _drain_batch(self) -> None:
+        """Run all pending main-thread tasks back-to-back in one callback."""
+        # Clear the flag first: a task queued while draining either gets
+        # picked up by this loop or schedules a new drain
+        self._batch_scheduled = False
+
+        pending = self._pending
+        while pending:
+            task = pending.popleft()
+            try:
+                task()
+            except Exception as e:
+                # Tasks report their own errors, so this only guards the drain
+                self.log_message(f"Error in main thread task: {str(e)}")
@@ -5,15 +5,56 @@ This module handles the socket server functionality for accepting and managing
 client connections to the Ableton Live Remote Script.
 """
 
+from collections import deque
 from collections.abc import Callable
+from functools import partial
+import os
+from pathlib import Path
+import selectors
 import socket
+import tempfile
 import threading
 import time
 from typing import Any
 
+from .client import SOCKET_BUFFER_SIZE
+
 # Constants for socket communication
 DEFAULT_PORT = 9877
 HOST = "localhost"
+# Seconds a listening socket is left alone after accept() fails, e.g. when
+# the process is out of file descriptors
+ACCEPT_RETRY_DELAY = 0.5
+
+
+def _default_unix_path() -> str | None:
+    """
+    Get the per-user path of the Unix domain socket.
+
+    Returns:
+        The path inside $XDG_RUNTIME_DIR, or else inside a directory in the
+        temp dir named after the user id, or None where Unix domain sockets
+        aren't available (Windows)
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return None
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    directory = Path(runtime_dir) if runtime_dir else Path(tempfile.gettempdir()) / f"ableton-mcp-{os.getuid()}"
+    return str(directory / "ableton-mcp.sock")
+
+
+# Local clients can skip the TCP stack through this Unix domain socket. It
+# lives in a directory only the current user can access, so other local
+# users can neither connect nor plant a socket there (not available on
+# Windows, where only the TCP port is served).
+DEFAULT_UNIX_PATH = _default_unix_path()
+
+# Prepares an accepted client given the server's call_soon and a function that
+# switches the client between waiting to write (True) and to read (False), and
+# returns the callback to run with the event mask whenever the client is ready
+ClientHandlerCallback = Callable[
+    [socket.socket, Callable[[Callable[[], None]], None], Callable[[bool], None]], Callable[[int], bool]
+]
 
 
 class SocketServer:
@@ -25,6 +66,7 @@ class SocketServer:
         message_handler: Callable[[str], None],
         port: int = DEFAULT_PORT,
         host: str = HOST,
+        unix_path: str | None = DEFAULT_UNIX_PATH,
     ):
         """
         Initialize the socket server.
@@ -34,30 +76,62 @@ class SocketServer:
             message_handler: Function to handle showing messages in Ableton
             port: Port number to listen on
             host: Host address to bind to
+            unix_path: Path of an additional Unix domain socket to listen on,
+                or None to only serve TCP
         """
         self.logger = logger
         self.message_handler = message_handler
         self.port = port
         self.host = host
+        self.unix_path = unix_path
 
         # Server state
         self.server: socket.socket | None = None
-        self.client_threads: list[threading.Thread] = []
+        self.unix_server: socket.socket | None = None
         self.server_thread: threading.Thread | None = None
         self.running = False
 
+        # Callbacks other threads asked to run on the server thread, and the
+        # socket pair whose read end wakes the selector up for them
+        self._callbacks: deque[Callable[[], None]] = deque()
+        self._wakeup_reader: socket.socket | None = None
+        self._wakeup_writer: socket.socket | None = None
+        # Listening sockets taken off the selector after an accept error,
+        # with the time to watch them again
+        self._paused_listeners: dict[socket.socket, float] = {}
+
         # Client handler callback
-        self.client_handler: Callable[[socket.socket], None] | None = None
+        self.client_handler: ClientHandlerCallback | None = None
 
-    def set_client_handler(self, handler: Callable[[socket.socket], None]) -> None:
+    def set_client_handler(self, handler: ClientHandlerCallback) -> None:
         """
         Set the client handler callback.
 
         Args:
-            handler: Function to handle client connections
+            handler: Function that prepares an accepted client, given the
+                server's call_soon and a function that switches the client
+                between waiting to write and to read, and returns the
+                callback to run whenever that client is ready
         """
         self.client_handler = handler
 
+    def call_soon(self, callback: Callable[[], None]) -> None:
+        """
+        Run a callback on the server thread. Safe to call from any thread.
+
+        Args:
+            callback: Function to run, e.g. one that writes a reply that was
+                produced on Live's main thread
+        """
+        # deque append is atomic, so the handoff needs no lock
+        self._callbacks.append(callback)
+        try:
+            self._wakeup_writer.send(b"\0")
+        except (AttributeError, OSError):
+            # Either the server is stopped or the pair's buffer is full, in
+            # which case a wakeup is already pending
+            pass
+
     def start(self) -> bool:
         """
         Start the socket server in a separate thread.
@@ -68,9 +142,22 @@ class SocketServer:
         try:
             self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Inherited by accepted sockets on most platforms; the client
+            # handler sets it again for those that don't
+            self.server.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Buffer sizes must be set before listen() to affect the TCP
+            # window scale negotiated for accepted connections
+            for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                self.server.setsockopt(socket.SOL_SOCKET, option, SOCKET_BUFFER_SIZE)
             self.server.bind((self.host, self.port))
             self.server.listen(5)  # Allow up to 5 pending connections
 
+            if self.unix_path:
+                self.unix_server = self._start_unix_server(self.unix_path)
+
+            self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+            self._wakeup_writer.setblocking(False)
+
             self.running = True
             self.server_thread = threading.Thread(target=self._server_thread)
             self.server_thread.daemon = True
@@ -95,60 +182,226 @@ class SocketServer:
                 self.server.close()
             except OSError:
                 pass
+        if self.unix_server:
+            try:
+                self.unix_server.close()
+                Path(self.unix_path).unlink(missing_ok=True)
+            except OSError:
+                pass
 
-        # Wait for the server thread to exit
+        # Wait for the server thread to exit; it closes the client sockets
         if self.server_thread and self.server_thread.is_alive():
             self.server_thread.join(1.0)
 
-        # Clean up any client threads
-        for client_thread in self.client_threads[:]:
-            if client_thread.is_alive():
-                # We don't join them as they might be stuck
-                msg = "Client thread still alive during disconnect"
-                self.logger.log_message(msg)
-
         self.logger.log_message("Socket server stopped")
 
+    def _start_unix_server(self, path: str) -> socket.socket | None:
+        """
+        Listen on a Unix domain socket next to the TCP port.
+
+        Failing to do so is not fatal since clients can still use TCP.
+
+        Args:
+            path: Filesystem path of the socket
+
+        Returns:
+            The listening socket, or None if it could not be created
+        """
+        socket_path = Path(path)
+        unix_server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # Anyone who can reach the socket can drive Live, so only use a
+            # directory that belongs to this user and nobody else can enter
+            socket_path.parent.mkdir(mode=0o700, exist_ok=True)
+            directory = socket_path.parent.stat()
+            if directory.st_uid != os.getuid() or directory.st_mode & 0o077:
+                raise OSError(f"{socket_path.parent} is not private to the current user")
+
+            # Remove a socket left behind by a previous Live session
+            if socket_path.is_socket():
+                socket_path.unlink()
+            unix_server.bind(path)
+            socket_path.chmod(0o600)
+            unix_server.listen(5)
+        except OSError as e:
+            unix_server.close()
+            self.logger.log_message(f"Could not listen on {path}: {str(e)}")
+            return None
+
+        self.logger.log_message(f"Server listening on {path}")
+        return unix_server
+
     def _server_thread(self) -> None:
-        """Server thread implementation - handles client connections."""
+        """
+        Server thread implementation.
+
+        A single selector multiplexes the listening socket and every client,
+        so the thread count stays constant however many clients connect.
+        """
+        selector = selectors.DefaultSelector()
+        self._paused_listeners.clear()
         try:
             self.logger.log_message("Server thread started")
-            # Set a timeout to allow regular checking of running flag
-            if self.server:
-                self.server.settimeout(1.0)
+            for listener in (self.server, self.unix_server, self._wakeup_reader):
+                if listener:
+                    listener.setblocking(False)
+                    # Listening sockets and the wakeup socket are the only
+                    # keys without a callback
+                    selector.register(listener, selectors.EVENT_READ)
 
             while self.running and self.server:
-                try:
-                    # Accept connections with timeout
-                    client, address = self.server.accept()
-                    msg = f"Connection accepted from {str(address)}"
+                timeout = self._resume_listeners(selector)
+                for key, events in selector.select(timeout):
+                    if key.fileobj is self._wakeup_reader:
+                        self._run_callbacks()
+                    elif key.data is None:
+                        self._accept(selector, key.fileobj)
+                    elif not self._run_client_callback(key.data, events):
+                        self._close_client(selector, key.fileobj)
+
+            self.logger.log_message("Server thread stopped")
+        except OSError as e:
+            self.logger.log_message(f"Server thread error: {str(e)}")
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    self._close_client(selector, key.fileobj)
+            selector.close()
+            for wakeup in (self._wakeup_reader, self._wakeup_writer):
+                if wakeup:
+                    wakeup.close()
+            self._wakeup_reader = self._wakeup_writer = None
+
+    def _resume_listeners(self, selector: selectors.BaseSelector) -> float:
+        """
+        Watch paused listening sockets again once their delay is over.
+
+        Args:
+            selector: The selector the listening sockets are registered with
+
+        Returns:
+            float: How long the next select may wait
+        """
+        # Wake up regularly to check the running flag
+        timeout = 1.0
+        now = time.monotonic()
+        for listener, resume_at in list(self._paused_listeners.items()):
+            if resume_at <= now:
+                del self._paused_listeners[listener]
+                selector.register(listener, selectors.EVENT_READ)
+            else:
+                timeout = min(timeout, resume_at - now)
+        return timeout
+
+    def _run_callbacks(self) -> None:
+        """Run the callbacks queued by call_soon."""
+        # Empty the wakeup socket first: a callback queued after this point
+        # sends a new byte, so the selector reports it again
+        try:
+            while self._wakeup_reader.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+        callbacks = self._callbacks
+        while callbacks:
+            callback = callbacks.popleft()
+            try:
+                callback()
+            except Exception as e:
+                self.logger.log_message(f"Error in server callback: {str(e)}")
+
+    def _accept(self, selector: selectors.BaseSelector, listener: Any) -> None:
+        """
+        Accept every pending connection and register them with the selector.
+
+        The listening socket is non-blocking, so the backlog is drained in
+        one wakeup until accept() reports there is nothing left.
+
+        Args:
+            selector: The selector the client sockets are registered with
+            listener: The listening socket that became readable
+        """
+        while self.running:
+            try:
+                client, address = listener.accept()
+            except BlockingIOError:
+                # Backlog drained
+                return
+            except OSError as e:
+                if self.running:  # Only log if still running
+                    msg = f"Server accept error: {str(e)}"
                     self.logger.log_message(msg)
-                    self.message_handler("AbletonMCP: Client connected")
+                # The listener would stay readable and spin the loop, but
+                # sleeping here would stall every client, so stop watching
+                # it for a moment instead
+                selector.unregister(listener)
+                self._paused_listeners[listener] = time.monotonic() + ACCEPT_RETRY_DELAY
+                return
+
+            msg = f"Connection accepted from {str(address or self.unix_path)}"
+            self.logger.log_message(msg)
+            self.message_handler("AbletonMCP: Client connected")
+
+            if self.client_handler:
+                set_writing = partial(self._set_writing, selector, client)
+                callback = self.client_handler(client, self.call_soon, set_writing)
+                selector.register(client, selectors.EVENT_READ, callback)
+            else:
+                client.close()
 
-                    # Handle client in a separate thread if handler is set
-                    if self.client_handler:
-                        client_thread = threading.Thread(target=self.client_handler, args=(client,))
-                        client_thread.daemon = True
-                        client_thread.start()
+    def _set_writing(self, selector: selectors.BaseSelector, client: Any, writing: bool) -> None:
+        """
+        Switch a client between waiting to flush its replies and waiting for
+        commands.
 
-                        # Keep track of client threads
-                        self.client_threads.append(client_thread)
+        Args:
+            selector: The selector the client socket is registered with
+            client: The client socket
+            writing: Whether to wait for the socket to become writable
+        """
+        events = selectors.EVENT_WRITE if writing else selectors.EVENT_READ
+        try:
+            key = selector.get_key(client)
+            if key.events != events:
+                selector.modify(client, events, key.data)
+        except (KeyError, ValueError):
+            # The client was closed already
+            pass
 
-                        # Clean up finished client threads
-                        self.client_threads = [t for t in self.client_threads if t.is_alive()]
+    def _run_client_callback(self, callback: Callable[[int], bool], events: int) -> bool:
+        """
+        Run a client's callback without letting it stop the server.
 
-                except TimeoutError:
-                    # No connection yet, just continue
-                    continue
-                except OSError as e:
-                    if self.running:  # Only log if still running
-                        msg = f"Server accept error: {str(e)}"
-                        self.logger.log_message(msg)
-                    time.sleep(0.5)
+        Args:
+            callback: The callback returned by the client handler
+            events: The selectors event mask the client socket is ready for
 
-            self.logger.log_message("Server thread stopped")
-        except OSError as e:
-            self.logger.log_message(f"Server thread error: {str(e)}")
+        Returns:
+            bool: False if the client connection should be closed
+        """
+        try:
+            return callback(events)
+        except Exception as e:
+            self.logger.log_message(f"Error in client handler: {str(e)}")
+            return False
+
+    def _close_client(self, selector: selectors.BaseSelector, client: Any) -> None:
+        """
+        Unregister and close a client socket.
+
+        Args:
+            selector: The selector the client socket is registered with
+            client: The client socket
+        """
+        try:
+            selector.unregister(client)
+        except (KeyError, ValueError):
+            pass
+        try:
+            client.close()
+        except OSError:
+            pass
 
     @property
     def is_running(self) -> bool:
@@ -1,36 +1,131 @@
 """Browser handlers for AbletonMCP Remote Script."""
 
-import traceback
+from collections import OrderedDict, deque
+import threading
 from typing import Any
 
 from ..utils import BaseHandler
 
+# Number of browser folders whose children are cached by name
+FOLDER_CACHE_SIZE = 128
+
+# Number of (category_type, depth) browser trees kept
+TREE_CACHE_SIZE = 16
+
+# Deepest level below the browser that URI lookups look at
+MAX_BROWSER_DEPTH = 10
+
+# Root browser categories and their display names
+BROWSER_CATEGORIES = {
+    "instruments": "Instruments",
+    "sounds": "Sounds",
+    "drums": "Drums",
+    "audio_effects": "Audio Effects",
+    "midi_effects": "MIDI Effects",
+}
+
+
+def _describe_browser_item(item: Any, folder_from_children: bool = False) -> dict[str, Any]:
+    """
+    Summarize a browser item for a response.
+
+    Each attribute is read once with getattr and a default, rather than
+    probed with hasattr and then read again, since every read crosses into
+    Live.
+
+    Args:
+        item: The browser item
+        folder_from_children: Whether is_folder means "has children", as the
+            tree and path listings report it, instead of Live's is_folder.
+            This loads the item's children from Live.
+
+    Returns:
+        dict: The item's name, flags and URI
+    """
+    if folder_from_children:
+        is_folder = bool(getattr(item, "children", None))
+    else:
+        is_folder = bool(getattr(item, "is_folder", False))
+    return {
+        "name": getattr(item, "name", "Unknown"),
+        "is_folder": is_folder,
+        "is_device": bool(getattr(item, "is_device", False)),
+        "is_loadable": bool(getattr(item, "is_loadable", False)),
+        "uri": getattr(item, "uri", None),
+    }
+
 
 class BrowserHandlers(BaseHandler):
     """Handlers for browser-related commands."""
 
+    def __init__(self, control_surface: Any) -> None:
+        """
+        Initialize the handler with a control surface.
+
+        Args:
+            control_surface: The control surface instance
+        """
+        super().__init__(control_surface)
+        # URI -> browser item, for every item the URI lookups have walked
+        # past so far; reused until invalidated
+        self._uri_index: dict[str, Any] = {}
+        # Root category -> (item, depth) pairs the lookups haven't visited
+        # yet. Each lookup resumes these walks only until it finds its item,
+        # so no single command walks the whole browser. None until the first
+        # lookup.
+        self._uri_walks: dict[str, deque[tuple[Any, int]]] | None = None
+        # URI lookups run on the server thread (get_browser_item) and on the
+        # main thread (load_browser_item), so the index and walks are only
+        # touched while holding this
+        self._uri_lock = threading.Lock()
+        # Folder URI -> {lowercase child name: child}, for path navigation
+        self._children_by_name: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # Path navigation and tree requests also run on both threads, so the
+        # LRU caches (this one and _tree_cache) are only touched while
+        # holding this. It's separate from _uri_lock so a
+        # long URI walk doesn't hold up cache hits.
+        self._cache_lock = threading.Lock()
+        # Public browser attributes, which don't change during a Live session
+        self._browser_attrs: list[str] | None = None
+        # (category_type, depth) -> browser tree, least recently used first,
+        # reused until invalidated
+        self._tree_cache: OrderedDict[tuple[str, int], dict[str, Any]] = OrderedDict()
+
+    def invalidate_browser_index(self) -> dict[str, Any]:
+        """
+        Drop the URI index, cached folder listings and cached trees so the
+        next lookups walk the browser again.
+
+        Returns:
+            dict: Confirmation that the index was cleared
+        """
+        with self._uri_lock:
+            self._reset_uri_index()
+        with self._cache_lock:
+            self._children_by_name.clear()
+            self._tree_cache.clear()
+        return {"invalidated": True}
+
     def get_browser_item(self, uri: str | None, path: str | None) -> dict[str, Any]:
         """Get a browser item by URI or path"""
+        if not uri and not path:
+            raise ValueError("Either uri or path must be provided")
+
         try:
             # Access the application's browser instance instead of creating a new one
             app = self.control_surface.application()
             if not app:
                 raise RuntimeError("Could not access Live application")
 
+            browser = app.browser
             result = {"uri": uri, "path": path, "found": False}
 
             # Try to find by URI first if provided
             if uri:
-                item = self._find_browser_item_by_uri(app.browser, uri)
+                item = self._find_browser_item_by_uri(browser, uri)
                 if item:
                     result["found"] = True
-                    result["item"] = {
-                        "name": item.name,
-                        "is_folder": item.is_folder,
-                        "is_device": item.is_device,
-                        "is_loadable": item.is_loadable,
-                        "uri": item.uri,
-                    }
+                    result["item"] = _describe_browser_item(item)
                     return result
 
             # If URI not provided or not found, try by path
@@ -39,20 +134,12 @@ class BrowserHandlers(BaseHandler):
                 path_parts = path.split("/")
 
                 # Determine the root based on the first part
-                current_item = None
-                if path_parts[0].lower() == "instruments":
-                    current_item = app.browser.instruments
-                elif path_parts[0].lower() == "sounds":
-                    current_item = app.browser.sounds
-                elif path_parts[0].lower() == "drums":
-                    current_item = app.browser.drums
-                elif path_parts[0].lower() == "audio_effects":
-                    current_item = app.browser.audio_effects
-                elif path_parts[0].lower() == "midi_effects":
-                    current_item = app.browser.midi_effects
+                root_category = path_parts[0].lower()
+                if root_category in BROWSER_CATEGORIES:
+                    current_item = getattr(browser, root_category)
                 else:
                     # Default to instruments if not specified
-                    current_item = app.browser.instruments
+                    current_item = browser.instruments
                     # Don't skip the first part in this case
                     path_parts = ["instruments"] + path_parts
 
@@ -62,31 +149,20 @@ class BrowserHandlers(BaseHandler):
                     if not part:  # Skip empty parts
                         continue
 
-                    found = False
-                    for child in current_item.children:
-                        if child.name.lower() == part.lower():
-                            current_item = child
-                            found = True
-                            break
-
-                    if not found:
+                    child = self._child_by_name(current_item, part.lower())
+                    if child is None:
                         result["error"] = f"Path part '{part}' not found"
                         return result
+                    current_item = child
 
                 # Found the item
                 result["found"] = True
-                result["item"] = {
-                    "name": current_item.name,
-                    "is_folder": current_item.is_folder,
-                    "is_device": current_item.is_device,
-                    "is_loadable": current_item.is_loadable,
-                    "uri": current_item.uri,
-                }
+                result["item"] = _describe_browser_item(current_item)
 
             return result
         except Exception as e:
-            self.log_message("Error getting browser item: " + str(e))
-            self.log_message(traceback.format_exc())
+            self.log_message(f"Error getting browser item: {e}")
+            self.log_traceback()
             raise
 
     def load_browser_item(self, track_index: int, item_uri: str) -> dict[str, Any]:
@@ -95,10 +171,10 @@ class BrowserHandlers(BaseHandler):
             track = self.get_track(track_index)
 
             # Access the application's browser instance instead of creating a new one
-            app = self.control_surface.application()
+            browser = self.control_surface.application().browser
 
             # Find the browser item by URI
-            item = self._find_browser_item_by_uri(app.browser, item_uri)
+            item = self._find_browser_item_by_uri(browser, item_uri)
 
             if not item:
                 raise ValueError(f"Browser item with URI '{item_uri}' not found")
@@ -107,7 +183,7 @@ class BrowserHandlers(BaseHandler):
             self._song.view.selected_track = track
 
             # Load the item
-            app.browser.load_item(item)
+            browser.load_item(item)
 
             result = {
                 "loaded": True,
@@ -117,20 +193,64 @@ class BrowserHandlers(BaseHandler):
             }
             return result
         except Exception as e:
-            self.log_message(f"Error loading browser item: {str(e)}")
-            self.log_message(traceback.format_exc())
+            self.log_message(f"Error loading browser item: {e}")
+            self.log_traceback()
             raise
 
-    def get_browser_tree(self, category_type: str = "all") -> dict[str, Any]:
+    def load_drum_kit(self, track_index: int, rack_uri: str, kit_path: str) -> dict[str, Any]:
+        """
+        Load a drum rack onto a track, then the first loadable kit at a path.
+
+        All steps run here next to the Live API, so the server needs a
+        single command instead of one per step.
+
+        Args:
+            track_index: Index of the track to load onto
+            rack_uri: URI of the drum rack to load
+            kit_path: Browser path of the folder holding the drum kits
+
+        Returns:
+            dict: The rack load result, the loaded kit's name (None if no
+            loadable kit was found) and an error if the path lookup failed
+        """
+        try:
+            result = self.load_browser_item(track_index, rack_uri)
+            result["kit_name"] = None
+
+            kits = self.get_browser_items_at_path(kit_path)
+            if "error" in kits:
+                result["error"] = kits["error"]
+                return result
+
+            kit = next((item for item in kits["items"] if item["is_loadable"]), None)
+            if kit is not None:
+                self.load_browser_item(track_index, kit["uri"])
+                result["kit_name"] = kit["name"]
+            return result
+        except Exception as e:
+            self.log_message(f"Error loading drum kit: {e}")
+            self.log_traceback()
+            raise
+
+    def get_browser_tree(self, category_type: str = "all", depth: int = 0) -> dict[str, Any]:
         """
         Get a simplified tree of browser categories.
 
         Args:
             category_type: Type of categories to get ('all', 'instruments', 'sounds', etc.)
+            depth: Number of levels of children to fill in below each category
 
         Returns:
             Dictionary with the browser tree structure
         """
+        depth = max(0, min(depth, MAX_BROWSER_DEPTH))
+        key = (category_type, depth)
+        with self._cache_lock:
+            cached = self._tree_cache.get(key)
+            if cached is not None:
+                self._tree_cache.move_to_end(key)
+                return cached
+
         try:
             # Access the application's browser instance instead of creating a new one
             app = self.control_surface.application()
@@ -138,12 +258,11 @@ class BrowserHandlers(BaseHandler):
                 raise RuntimeError("Could not access Live application")
 
             # Check if browser is available
-            if not hasattr(app, "browser") or app.browser is None:
+            browser = getattr(app, "browser", None)
+            if browser is None:
                 raise RuntimeError("Browser is not available in the Live application")
 
-            # Log available browser attributes to help diagnose issues
-            browser_attrs = [attr for attr in dir(app.browser) if not attr.startswith("_")]
-            self.log_message(f"Available browser attributes: {browser_attrs}")
+            browser_attrs = self._get_browser_attrs(browser)
 
             result = {
                 "type": category_type,
@@ -151,99 +270,74 @@ class BrowserHandlers(BaseHandler):
                 "available_categories": browser_attrs,
             }
 
-            # Helper function to process a browser item and its children
-            def process_item(item: Any, depth: int = 0) -> dict[str, Any] | None:
+            def process_item(item: Any) -> dict[str, Any] | None:
                 if not item:
                     return None
+                category = _describe_browser_item(item, folder_from_children=True)
+                category["children"] = []
+                if depth:
+                    self._fill_children(category, item, depth)
+                return category
+
+            # Process the standard categories first, then any other
+            # categories this Live version exposes
+            for attr, display_name in BROWSER_CATEGORIES.items():
+                if category_type in ("all", attr) and hasattr(browser, attr):
+                    try:
+                        category = process_item(getattr(browser, attr))
+                        if category:
+                            category["name"] = display_name  # Ensure consistent naming
+                            result["categories"].append(category)
+                    except Exception as e:
+                        self.log_message(f"Error processing {attr}: {e}")
 
-                result: dict[str, Any] = {
-                    "name": item.name if hasattr(item, "name") else "Unknown",
-                    "is_folder": hasattr(item, "children") and bool(item.children),
-                    "is_device": hasattr(item, "is_device") and item.is_device,
-                    "is_loadable": hasattr(item, "is_loadable") and item.is_loadable,
-                    "uri": item.uri if hasattr(item, "uri") else None,
-                    "children": [],
-                }
-
-                return result
-
-            # Process based on category type and available attributes
-            if (category_type == "all" or category_type == "instruments") and hasattr(app.browser, "instruments"):
-                try:
-                    instruments = process_item(app.browser.instruments)
-                    if instruments:
-                        instruments["name"] = "Instruments"  # Ensure consistent naming
-                        result["categories"].append(instruments)
-                except Exception as e:
-                    self.log_message(f"Error processing instruments: {str(e)}")
-
-            if (category_type == "all" or category_type == "sounds") and hasattr(app.browser, "sounds"):
-                try:
-                    sounds = process_item(app.browser.sounds)
-                    if sounds:
-                        sounds["name"] = "Sounds"  # Ensure consistent naming
-                        result["categories"].append(sounds)
-                except Exception as e:
-                    self.log_message(f"Error processing sounds: {str(e)}")
-
-            if (category_type == "all" or category_type == "drums") and hasattr(app.browser, "drums"):
-                try:
-                    drums = process_item(app.browser.drums)
-                    if drums:
-                        drums["name"] = "Drums"  # Ensure consistent naming
-                        result["categories"].append(drums)
-                except Exception as e:
-                    self.log_message(f"Error processing drums: {str(e)}")
-
-            if (category_type == "all" or category_type == "audio_effects") and hasattr(app.browser, "audio_effects"):
-                try:
-                    audio_effects = process_item(app.browser.audio_effects)
-                    if audio_effects:
-                        audio_effects["name"] = "Audio Effects"  # Ensure consistent naming
-                        result["categories"].append(audio_effects)
-                except Exception as e:
-                    self.log_message(f"Error processing audio_effects: {str(e)}")
-
-            if (category_type == "all" or category_type == "midi_effects") and hasattr(app.browser, "midi_effects"):
-                try:
-                    midi_effects = process_item(app.browser.midi_effects)
-                    if midi_effects:
-                        midi_effects["name"] = "MIDI Effects"
-                        result["categories"].append(midi_effects)
-                except Exception as e:
-                    self.log_message(f"Error processing midi_effects: {str(e)}")
-
-            # Try to process other potentially available categories
             for attr in browser_attrs:
-                if attr not in [
-                    "instruments",
-                    "sounds",
-                    "drums",
-                    "audio_effects",
-                    "midi_effects",
-                ] and (category_type == "all" or category_type == attr):
+                if attr not in BROWSER_CATEGORIES and category_type in ("all", attr):
                     try:
-                        item = getattr(app.browser, attr)
+                        item = getattr(browser, attr)
                         if hasattr(item, "children") or hasattr(item, "name"):
                             category = process_item(item)
                             if category:
                                 category["name"] = attr.capitalize()
                                 result["categories"].append(category)
                     except Exception as e:
-                        self.log_message(f"Error processing {attr}: {str(e)}")
+                        self.log_message(f"Error processing {attr}: {e}")
 
             self.log_message(
                 "Browser tree generated for {0} with {1} root categories".format(
                     category_type, len(result["categories"])
                 )
             )
+            with self._cache_lock:
+                self._tree_cache[key] = result
+                if len(self._tree_cache) > TREE_CACHE_SIZE:
+                    self._tree_cache.popitem(last=False)
             return result
 
         except Exception as e:
-            self.log_message(f"Error getting browser tree: {str(e)}")
-            self.log_message(traceback.format_exc())
+            self.log_message(f"Error getting browser tree: {e}")
+            self.log_traceback()
             raise
 
+    def _fill_children(self, category: dict[str, Any], item: Any, depth: int) -> None:
+        """
+        Fill in the children of a tree category, level by level.
+
+        Args:
+            category: The category dict whose children list is filled in
+            item: The browser item the category describes
+            depth: Number of levels below the category to fill in
+        """
+        queue = deque([(category, item, 0)])
+        while queue:
+            node, node_item, level = queue.popleft()
+            for child in getattr(node_item, "children", None) or ():
+                child_node = _describe_browser_item(child, folder_from_children=True)
+                child_node["children"] = []
+                node["children"].append(child_node)
+                if level + 1 < depth:
+                    queue.append((child_node, child, level + 1))
+
     def get_browser_items_at_path(self, path: str) -> dict[str, Any]:
         """
         Get browser items at a specific path.
@@ -263,12 +357,11 @@ class BrowserHandlers(BaseHandler):
                 raise RuntimeError("Could not access Live application")
 
             # Check if browser is available
-            if not hasattr(app, "browser") or app.browser is None:
+            browser = getattr(app, "browser", None)
+            if browser is None:
                 raise RuntimeError("Browser is not available in the Live application")
 
-            # Log available browser attributes to help diagnose issues
-            browser_attrs = [attr for attr in dir(app.browser) if not attr.startswith("_")]
-            self.log_message(f"Available browser attributes: {browser_attrs}")
+            browser_attrs = self._get_browser_attrs(browser)
 
             # Parse the path
             path_parts = path.split("/")
@@ -280,27 +373,19 @@ class BrowserHandlers(BaseHandler):
             current_item = None
 
             # Check standard categories first
-            if root_category == "instruments" and hasattr(app.browser, "instruments"):
-                current_item = app.browser.instruments
-            elif root_category == "sounds" and hasattr(app.browser, "sounds"):
-                current_item = app.browser.sounds
-            elif root_category == "drums" and hasattr(app.browser, "drums"):
-                current_item = app.browser.drums
-            elif root_category == "audio_effects" and hasattr(app.browser, "audio_effects"):
-                current_item = app.browser.audio_effects
-            elif root_category == "midi_effects" and hasattr(app.browser, "midi_effects"):
-                current_item = app.browser.midi_effects
+            if root_category in BROWSER_CATEGORIES and hasattr(browser, root_category):
+                current_item = getattr(browser, root_category)
             else:
                 # Try to find the category in other browser attributes
                 found = False
                 for attr in browser_attrs:
                     if attr.lower() == root_category:
                         try:
-                            current_item = getattr(app.browser, attr)
+                            current_item = getattr(browser, attr)
                             found = True
                             break
                         except Exception as e:
-                            self.log_message(f"Error accessing browser attribute {attr}: {str(e)}")
+                            self.log_message(f"Error accessing browser attribute {attr}: {e}")
 
                 if not found:
                     # If we still haven't found the category, return available categories
@@ -324,94 +409,211 @@ class BrowserHandlers(BaseHandler):
                         "items": [],
                     }
 
-                found = False
-                for child in current_item.children:
-                    if hasattr(child, "name") and child.name.lower() == part.lower():
-                        current_item = child
-                        found = True
-                        break
-
-                if not found:
+                child = self._child_by_name(current_item, part.lower())
+                if child is None:
                     return {
                         "path": path,
                         "error": f"Path part '{part}' not found",
                         "items": [],
                     }
+                current_item = child
 
             # Get items at the current path
             items = []
             if hasattr(current_item, "children"):
-                for child in current_item.children:
-                    item_info = {
-                        "name": child.name if hasattr(child, "name") else "Unknown",
-                        "is_folder": hasattr(child, "children") and bool(child.children),
-                        "is_device": hasattr(child, "is_device") and child.is_device,
-                        "is_loadable": hasattr(child, "is_loadable") and child.is_loadable,
-                        "uri": child.uri if hasattr(child, "uri") else None,
-                    }
-                    items.append(item_info)
+                items = [_describe_browser_item(child, folder_from_children=True) for child in current_item.children]
 
-            result = {
-                "path": path,
-                "name": current_item.name if hasattr(current_item, "name") else "Unknown",
-                "uri": current_item.uri if hasattr(current_item, "uri") else None,
-                "is_folder": hasattr(current_item, "children") and bool(current_item.children),
-                "is_device": hasattr(current_item, "is_device") and current_item.is_device,
-                "is_loadable": hasattr(current_item, "is_loadable") and current_item.is_loadable,
-                "items": items,
-            }
+            result = {"path": path, **_describe_browser_item(current_item, folder_from_children=True), "items": items}
 
             self.log_message(f"Retrieved {len(items)} items at path: {path}")
             return result
 
         except Exception as e:
-            self.log_message(f"Error getting browser items at path: {str(e)}")
-            self.log_message(traceback.format_exc())
+            self.log_message(f"Error getting browser items at path: {e}")
+            self.log_traceback()
             raise
 
-    def _find_browser_item_by_uri(
-        self,
-        browser_or_item: Any,
-        uri: str,
-        max_depth: int = 10,
-        current_depth: int = 0,
-    ) -> Any:
-        """Find a browser item by its URI"""
-        try:
-            # Check if this is the item we're looking for
-            if hasattr(browser_or_item, "uri") and browser_or_item.uri == uri:
-                return browser_or_item
-
-            # Stop recursion if we've reached max depth
-            if current_depth >= max_depth:
-                return None
-
-            # Check if this is a browser with root categories
-            if hasattr(browser_or_item, "instruments"):
-                # Check all main categories
-                categories = [
-                    browser_or_item.instruments,
-                    browser_or_item.sounds,
-                    browser_or_item.drums,
-                    browser_or_item.audio_effects,
-                    browser_or_item.midi_effects,
-                ]
-
-                for category in categories:
-                    item = self._find_browser_item_by_uri(category, uri, max_depth, current_depth + 1)
-                    if item:
-                        return item
+    def _get_browser_attrs(self, browser: Any) -> list[str]:
+        """
+        Get the public attributes of the browser, computed once per session.
+
+        Args:
+            browser: The Live browser
+
+        Returns:
+            list: Names of the browser's public attributes
+        """
+        if self._browser_attrs is None:
+            self._browser_attrs = [attr for attr in dir(browser) if not attr.startswith("_")]
+            # Log available browser attributes to help diagnose issues
+            self.log_message(f"Available browser attributes: {self._browser_attrs}")
+        return self._browser_attrs
+
+    def _child_by_name(self, item: Any, name: str) -> Any:
+        """
+        Find a child of a browser folder by case-insensitive name.
+
+        The name -> child mapping of each visited folder is cached by the
+        folder's URI, so navigating the same path again is a dict lookup per
+        path part instead of a scan over the folder's children.
+
+        Args:
+            item: The browser folder
+            name: Lowercase name of the child to find
+
+        Returns:
+            The child item, or None if the folder has no such child
+        """
+        cache = self._children_by_name
+        key = getattr(item, "uri", None)
+        children = None
+        if key is not None:
+            with self._cache_lock:
+                children = cache.get(key)
+                if children is not None:
+                    cache.move_to_end(key)
+        if children is None:
+            # Read the folder from Live without holding the lock
+            children = {}
+            for child in item.children:
+                if hasattr(child, "name"):
+                    # Keep the first match, like a linear scan would
+                    children.setdefault(child.name.lower(), child)
+            if key is not None:
+                with self._cache_lock:
+                    cache[key] = children
+                    if len(cache) > FOLDER_CACHE_SIZE:
+                        cache.popitem(last=False)
+        return children.get(name)
+
+    def _find_browser_item_by_uri(self, browser: Any, uri: str) -> Any:
+        """
+        Find a browser item by its URI using the URI index.
 
-                return None
+        Args:
+            browser: The Live browser
+            uri: URI of the item to find
 
-            # Check if this item has children
-            if hasattr(browser_or_item, "children") and browser_or_item.children:
-                for child in browser_or_item.children:
-                    item = self._find_browser_item_by_uri(child, uri, max_depth, current_depth + 1)
-                    if item:
+        Returns:
+            The browser item, or None if it was not found
+        """
+        with self._uri_lock:
+            item = self._uri_index.get(uri)
+            if item is not None:
+                try:
+                    if item.uri == uri:
                         return item
+                except Exception:
+                    pass
+                # Items go stale when packs are reloaded; start over
+                self._reset_uri_index()
+
+            if self._uri_walks is None:
+                self._uri_walks = {
+                    attr: deque([(getattr(browser, attr), 1)]) for attr in BROWSER_CATEGORIES if hasattr(browser, attr)
+                }
+                walked_everything = False
+            else:
+                walked_everything = not any(self._uri_walks.values())
+
+            item = self._walk_uri_index(browser, uri)
+            if item is None and walked_everything:
+                # Content added since the walks finished is only found by a
+                # search
+                item = self._search_browser_item_by_uri(browser, uri)
+                if item is not None:
+                    self._uri_index[uri] = item
+            return item
+
+    def _reset_uri_index(self) -> None:
+        """Forget the URI index and walks. Call with _uri_lock held."""
+        self._uri_index = {}
+        self._uri_walks = None
+
+    def _walk_uri_index(self, browser: Any, uri: str, max_depth: int = MAX_BROWSER_DEPTH) -> Any:
+        """
+        Resume the index walks until an item with the URI turns up.
 
-            return None
-        except Exception as e:
-            self.log_message(f"Error finding browser item by URI: {str(e)}")
-            return None
+        Every item visited on the way is added to the index. Each root is
+        walked breadth-first, and roots whose own URI shares the searched
+        URI's prefix (the part before '#') are walked first. Call with
+        _uri_lock held.
+
+        Args:
+            browser: The Live browser
+            uri: URI of the item to find
+            max_depth: Maximum depth below the browser to walk
+
+        Returns:
+            The browser item, or None if the walks finished without it
+        """
+        index = self._uri_index
+        walks = self._uri_walks
+        prefix = uri.split("#", 1)[0]
+        preferred = [
+            attr
+            for attr, queue in walks.items()
+            if queue and (getattr(getattr(browser, attr, None), "uri", None) or "").split("#", 1)[0] == prefix
+        ]
+        for attr in preferred + [attr for attr in walks if attr not in preferred]:
+            queue = walks[attr]
+            while queue:
+                item, depth = queue.popleft()
+                item_uri = None
+                try:
+                    item_uri = getattr(item, "uri", None)
+                    if item_uri is not None:
+                        index.setdefault(item_uri, item)
+                    if depth < max_depth:
+                        queue.extend((child, depth + 1) for child in getattr(item, "children", ()))
+                except Exception as e:
+                    # Skip the failing subtree and keep walking
+                    self.log_message(f"Error indexing browser item: {e}")
+                if item_uri == uri:
+                    return item
+        return None
+
+    def _search_browser_item_by_uri(self, browser: Any, uri: str, max_depth: int = MAX_BROWSER_DEPTH) -> Any:
+        """
+        Search the browser tree for an item by its URI.
+
+        The tree is walked breadth-first, in the same order the index is
+        built, so items near the top of a category are found first. Root
+        categories whose own URI shares the searched URI's prefix (the part
+        before '#') are searched before the others.
+
+        Args:
+            browser: The Live browser
+            uri: URI of the item to find
+            max_depth: Maximum depth below the browser to search
+
+        Returns:
+            The browser item, or None if it was not found
+        """
+        prefix = uri.split("#", 1)[0]
+        preferred = []
+        others = []
+        for attr in BROWSER_CATEGORIES:
+            root = getattr(browser, attr, None)
+            if root is None:
+                continue
+            root_uri = getattr(root, "uri", None) or ""
+            if root_uri and root_uri.split("#", 1)[0] == prefix:
+                preferred.append(root)
+            else:
+                others.append(root)
+
+        for roots in (preferred, others):
+            queue = deque((root, 1) for root in roots)
+            while queue:
+                item, depth = queue.popleft()
+                try:
+                    if getattr(item, "uri", None) == uri:
+                        return item
+                    if depth < max_depth:
+                        for child in getattr(item, "children", ()):
+                            queue.append((child, depth + 1))
+                except Exception as e:
+                    # Skip the failing subtree and keep searching
+                    self.log_message(f"Error finding browser item by URI: {e}")
+        return None
@@ -1,13 +1,70 @@
 """Clip management handlers for AbletonMCP Remote Script."""
 
+from collections import OrderedDict
 from typing import Any
 
-from ..utils import BaseHandler, validate_note_data
+from ..utils import BaseHandler, convert_note_data
+
+# Number of clip slots remembered by (track_index, clip_index)
+CLIP_SLOT_CACHE_SIZE = 32
 
 
 class ClipHandlers(BaseHandler):
     """Handlers for clip-related commands."""
 
+    def __init__(self, control_surface: Any) -> None:
+        """
+        Initialize the handler with a control surface.
+
+        Args:
+            control_surface: The control surface instance
+        """
+        super().__init__(control_surface)
+        # Clip commands tend to hit the same slot back to back (create, name,
+        # add notes, fire). A slot stays at its indices until tracks or
+        # scenes are added, removed or moved, which clears the cache.
+        self._slot_cache: OrderedDict[tuple[int, int], Any] = OrderedDict()
+        self._song.add_tracks_listener(self._clear_slot_cache)
+        self._song.add_scenes_listener(self._clear_slot_cache)
+
+    def disconnect(self) -> None:
+        """Remove the song listeners registered by this handler."""
+        if self._song.tracks_has_listener(self._clear_slot_cache):
+            self._song.remove_tracks_listener(self._clear_slot_cache)
+        if self._song.scenes_has_listener(self._clear_slot_cache):
+            self._song.remove_scenes_listener(self._clear_slot_cache)
+
+    def get_clip_slot(self, track_index: int, clip_index: int) -> Any:
+        """
+        Get a clip slot by track and clip index, reusing recent lookups.
+
+        Args:
+            track_index: The index of the track
+            clip_index: The index of the clip slot
+
+        Returns:
+            ClipSlot object
+
+        Raises:
+            IndexError: If track or clip index is out of range
+        """
+        key = (track_index, clip_index)
+        cache = self._slot_cache
+        clip_slot = cache.get(key)
+        if clip_slot is not None:
+            cache.move_to_end(key)
+            return clip_slot
+
+        clip_slot = super().get_clip_slot(track_index, clip_index)
+        cache[key] = clip_slot
+        if len(cache) > CLIP_SLOT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return clip_slot
+
+    def _clear_slot_cache(self) -> None:
+        """Forget cached clip slots after the track or scene layout changed."""
+        self._slot_cache.clear()
+
     def create_clip(self, track_index: int, clip_index: int, length: float) -> dict[str, Any]:
         """Create a new MIDI clip in the specified track and clip slot"""
         try:
@@ -23,7 +80,7 @@ class ClipHandlers(BaseHandler):
             result = {"name": clip_slot.clip.name, "length": clip_slot.clip.length}
             return result
         except Exception as e:
-            self.log_message("Error creating clip: " + str(e))
+            self.log_message(f"Error creating clip: {e}")
             raise
 
     def add_notes_to_clip(self, track_index: int, clip_index: int, notes: list[dict[str, Any]]) -> dict[str, Any]:
@@ -36,27 +93,16 @@ class ClipHandlers(BaseHandler):
 
             clip = clip_slot.clip
 
-            # Validate and convert note data to Live's format
-            live_notes = []
-            for note in notes:
-                # Validate note data
-                validate_note_data(note)
-
-                pitch = note.get("pitch", 60)
-                start_time = note.get("start_time", 0.0)
-                duration = note.get("duration", 0.25)
-                velocity = note.get("velocity", 100)
-                mute = note.get("mute", False)
-
-                live_notes.append((pitch, start_time, duration, velocity, mute))
+            # Validate and convert note data to Live's format in one pass
+            live_notes = tuple(map(convert_note_data, notes))
 
             # Add the notes
-            clip.set_notes(tuple(live_notes))
+            clip.set_notes(live_notes)
 
             result = {"note_count": len(notes)}
             return result
         except Exception as e:
-            self.log_message("Error adding notes to clip: " + str(e))
+            self.log_message(f"Error adding notes to clip: {e}")
             raise
 
     def set_clip_name(self, track_index: int, clip_index: int, name: str) -> dict[str, Any]:
@@ -73,7 +119,7 @@ class ClipHandlers(BaseHandler):
             result = {"name": clip.name}
             return result
         except Exception as e:
-            self.log_message("Error setting clip name: " + str(e))
+            self.log_message(f"Error setting clip name: {e}")
             raise
 
     def fire_clip(self, track_index: int, clip_index: int) -> dict[str, Any]:
@@ -90,7 +136,7 @@ class ClipHandlers(BaseHandler):
             result = {"fired": True, "name": clip_slot.clip.name}
             return result
         except Exception as e:
-            self.log_message("Error firing clip: " + str(e))
+            self.log_message(f"Error firing clip: {e}")
             raise
 
     def stop_clip(self, track_index: int, clip_index: int) -> dict[str, Any]:
@@ -107,5 +153,5 @@ class ClipHandlers(BaseHandler):
             result = {"stopped": True, "name": clip_slot.clip.name}
             return result
         except Exception as e:
-            self.log_message("Error stopping clip: " + str(e))
+            self.log_message(f"Error stopping clip: {e}")
             raise
@@ -16,7 +16,7 @@ class PlaybackHandlers(BaseHandler):
             result = {"playing": self._song.is_playing}
             return result
         except Exception as e:
-            self.log_message("Error starting playback: " + str(e))
+            self.log_message(f"Error starting playback: {e}")
             raise
 
     def stop_playback(self) -> dict[str, Any]:
@@ -27,5 +27,5 @@ class PlaybackHandlers(BaseHandler):
             result = {"playing": self._song.is_playing}
             return result
         except Exception as e:
-            self.log_message("Error stopping playback: " + str(e))
+            self.log_message(f"Error stopping playback: {e}")
             raise
@@ -4,12 +4,87 @@ from typing import Any
 
 from ..utils import BaseHandler, validate_tempo
 
+# Song properties whose listeners invalidate the cached session info
+_SESSION_PROPERTIES = ("tempo", "signature_numerator", "signature_denominator", "tracks", "return_tracks")
+
+# (class name, class display name) -> device type, filled in as devices are
+# seen. Plug-ins all share one class name, so the display name is part of the
+# key. Neither changes for a device, so entries never go stale.
+_device_types: dict[tuple[str, str], str] = {}
+
+
+def _describe_clip_slot(index: int, slot: Any) -> dict[str, Any]:
+    """
+    Summarize a clip slot for a track info response.
+
+    has_clip is read once, and an empty slot's clip is never touched.
+
+    Args:
+        index: The index of the clip slot
+        slot: The clip slot
+
+    Returns:
+        dict: The slot's index, whether it holds a clip, and the clip's details
+    """
+    if not slot.has_clip:
+        return {"index": index, "has_clip": False, "clip": None}
+    clip = slot.clip
+    return {
+        "index": index,
+        "has_clip": True,
+        "clip": {
+            "name": clip.name,
+            "length": clip.length,
+            "is_playing": clip.is_playing,
+            "is_recording": clip.is_recording,
+        },
+    }
+
 
 class SessionHandlers(BaseHandler):
     """Handlers for session and track-related commands."""
 
+    def __init__(self, control_surface: Any) -> None:
+        """
+        Initialize the handler with a control surface.
+
+        Args:
+            control_surface: The control surface instance
+        """
+        super().__init__(control_surface)
+        # Clients poll get_session_info often, so its result is kept until
+        # Live reports a change to one of its fields
+        self._session_info: dict[str, Any] | None = None
+        # Bumped on every change, so a result read while Live was changing
+        # the session isn't cached
+        self._session_version = 0
+        for name in _SESSION_PROPERTIES:
+            getattr(self._song, f"add_{name}_listener")(self._clear_session_info)
+        mixer = self._song.master_track.mixer_device
+        for parameter in (mixer.volume, mixer.panning):
+            parameter.add_value_listener(self._clear_session_info)
+
+    def disconnect(self) -> None:
+        """Remove the song listeners registered by this handler."""
+        for name in _SESSION_PROPERTIES:
+            if getattr(self._song, f"{name}_has_listener")(self._clear_session_info):
+                getattr(self._song, f"remove_{name}_listener")(self._clear_session_info)
+        mixer = self._song.master_track.mixer_device
+        for parameter in (mixer.volume, mixer.panning):
+            if parameter.value_has_listener(self._clear_session_info):
+                parameter.remove_value_listener(self._clear_session_info)
+
+    def _clear_session_info(self) -> None:
+        """Forget the cached session info after the session changed."""
+        self._session_info = None
+        self._session_version += 1
+
     def get_session_info(self) -> dict[str, Any]:
         """Get information about the current session"""
+        if self._session_info is not None:
+            return self._session_info
+
+        version = self._session_version
         try:
             result = {
                 "tempo": self._song.tempo,
@@ -23,9 +98,11 @@ class SessionHandlers(BaseHandler):
                     "panning": self._song.master_track.mixer_device.panning.value,
                 },
             }
+            if version == self._session_version:
+                self._session_info = result
             return result
         except Exception as e:
-            self.log_message("Error getting session info: " + str(e))
+            self.log_message(f"Error getting session info: {e}")
             raise
 
     def get_track_info(self, track_index: int) -> dict[str, Any]:
@@ -33,32 +110,16 @@ class SessionHandlers(BaseHandler):
         try:
             track = self.get_track(track_index)
 
-            # Get clip slots
-            clip_slots = []
-            for slot_index, slot in enumerate(track.clip_slots):
-                clip_info = None
-                if slot.has_clip:
-                    clip = slot.clip
-                    clip_info = {
-                        "name": clip.name,
-                        "length": clip.length,
-                        "is_playing": clip.is_playing,
-                        "is_recording": clip.is_recording,
-                    }
-
-                clip_slots.append({"index": slot_index, "has_clip": slot.has_clip, "clip": clip_info})
-
-            # Get devices
-            devices = []
-            for device_index, device in enumerate(track.devices):
-                devices.append(
-                    {
-                        "index": device_index,
-                        "name": device.name,
-                        "type": self._get_device_type(device),
-                        "is_enabled": device.is_enabled,
-                    }
-                )
+            clip_slots = [_describe_clip_slot(index, slot) for index, slot in enumerate(track.clip_slots)]
+            devices = [
+                {
+                    "index": index,
+                    "name": device.name,
+                    "type": self._get_device_type(device),
+                    "is_enabled": device.is_enabled,
+                }
+                for index, device in enumerate(track.devices)
+            ]
 
             result = {
                 "index": track_index,
@@ -75,7 +136,7 @@ class SessionHandlers(BaseHandler):
             }
             return result
         except Exception as e:
-            self.log_message("Error getting track info: " + str(e))
+            self.log_message(f"Error getting track info: {e}")
             raise
 
     def create_midi_track(self, index: int) -> dict[str, Any]:
@@ -91,7 +152,7 @@ class SessionHandlers(BaseHandler):
             result = {"index": new_track_index, "name": new_track.name}
             return result
         except Exception as e:
-            self.log_message("Error creating MIDI track: " + str(e))
+            self.log_message(f"Error creating MIDI track: {e}")
             raise
 
     def set_track_name(self, track_index: int, name: str) -> dict[str, Any]:
@@ -103,7 +164,7 @@ class SessionHandlers(BaseHandler):
             result = {"name": track.name}
             return result
         except Exception as e:
-            self.log_message("Error setting track name: " + str(e))
+            self.log_message(f"Error setting track name: {e}")
             raise
 
     def set_tempo(self, tempo: float) -> dict[str, Any]:
@@ -117,24 +178,34 @@ class SessionHandlers(BaseHandler):
             result = {"tempo": self._song.tempo}
             return result
         except Exception as e:
-            self.log_message("Error setting tempo: " + str(e))
+            self.log_message(f"Error setting tempo: {e}")
             raise
 
     def _get_device_type(self, device: Any) -> str:
         """Get the type of a device"""
         try:
-            # Simple heuristic - in a real implementation you'd look at the device class
-            if device.can_have_drum_pads:
-                return "drum_machine"
-            elif device.can_have_chains:
-                return "rack"
-            elif "instrument" in device.class_display_name.lower():
-                return "instrument"
-            elif "audio_effect" in device.class_name.lower():
-                return "audio_effect"
-            elif "midi_effect" in device.class_name.lower():
-                return "midi_effect"
-            else:
-                return "unknown"
-        except:
+            # The type only depends on the device's class and display name,
+            # so it's worked out once per pair
+            key = (device.class_name, device.class_display_name)
+            device_type = _device_types.get(key)
+            if device_type is None:
+                device_type = _device_types[key] = self._classify_device(device, *key)
+            return device_type
+        except Exception:
+            return "unknown"
+
+    def _classify_device(self, device: Any, class_name: str, class_display_name: str) -> str:
+        """Work out the type of a device from its capabilities and class"""
+        # Simple heuristic - in a real implementation you'd look at the device class
+        if device.can_have_drum_pads:
+            return "drum_machine"
+        elif device.can_have_chains:
+            return "rack"
+        elif "instrument" in class_display_name.lower():
+            return "instrument"
+        elif "audio_effect" in class_name.lower():
+            return "audio_effect"
+        elif "midi_effect" in class_name.lower():
+            return "midi_effect"
+        else:
             return "unknown"
@@ -9,6 +9,7 @@ from .error_handling import (
 )
 from .logging import RemoteScriptLogger
 from .validation import (
+    convert_note_data,
     validate_clip_index,
     validate_clip_length,
     validate_note_data,
@@ -27,6 +28,7 @@ __all__ = [
     "validate_tempo",
     "validate_clip_length",
     "validate_note_data",
+    "convert_note_data",
     # Error handling utilities
     "handle_exception",
     "safe_execute",
@@ -1,6 +1,7 @@
 """Base handler class for AbletonMCP Remote Script handlers."""
 
 from collections.abc import Callable
+import traceback
 from typing import Any
 
 from .error_handling import handle_exception, safe_execute
@@ -41,6 +42,11 @@ class BaseHandler:
         """
         self.logger.log_error(message, exception)
 
+    def log_traceback(self) -> None:
+        """Log the traceback of the exception being handled, in debug mode only."""
+        if self.control_surface._debug:
+            self.log_message(traceback.format_exc())
+
     def handle_exception(self, operation_name: str, exception: Exception) -> dict[str, Any]:
         """
         Handle exceptions with consistent logging and error formatting.
@@ -113,8 +119,12 @@ class BaseHandler:
         Raises:
             IndexError: If track index is out of range
         """
-        self.validate_track_index(track_index)
-        return self._song.tracks[track_index]
+        # Read the tracks once for both the range check and the lookup;
+        # each read of song.tracks crosses into Live
+        tracks = self._song.tracks
+        if not 0 <= track_index < len(tracks):
+            raise IndexError("Track index out of range")
+        return tracks[track_index]
 
     def get_clip_slot(self, track_index: int, clip_index: int) -> Any:
         """
@@ -130,6 +140,7 @@ class BaseHandler:
         Raises:
             IndexError: If track or clip index is out of range
         """
-        track = self.get_track(track_index)
-        self.validate_clip_index(clip_index, track)
-        return track.clip_slots[clip_index]
+        clip_slots = self.get_track(track_index).clip_slots
+        if not 0 <= clip_index < len(clip_slots):
+            raise IndexError("Clip index out of range")
+        return clip_slots[clip_index]
@@ -1,6 +1,5 @@
 """Error handling utilities for AbletonMCP Remote Script."""
 
-import traceback
 from typing import Any, Callable
 
 
@@ -16,9 +15,7 @@ def handle_exception(logger: Any, operation_name: str, exception: Exception) ->
     Returns:
         dict: Error response dictionary
     """
-    error_message = f"Error {operation_name}: {str(exception)}"
-    logger.log_message(error_message)
-    logger.log_message(traceback.format_exc())
+    logger.log_error_with_traceback(f"Error {operation_name}: {exception}")
 
     return {"status": "error", "message": str(exception), "operation": operation_name}
 
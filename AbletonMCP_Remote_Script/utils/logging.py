@@ -1,5 +1,6 @@
 """Logging utilities for AbletonMCP Remote Script."""
 
+import traceback
 from typing import Any
 
 
@@ -33,10 +34,22 @@ class RemoteScriptLogger:
             exception: Optional exception to include in the log
         """
         if exception:
-            self.log_message(f"Error: {message} - {str(exception)}")
+            self.log_message(f"Error: {message} - {exception}")
         else:
             self.log_message(f"Error: {message}")
 
+    def log_error_with_traceback(self, message: str) -> None:
+        """
+        Log an error message, followed by the traceback of the exception
+        being handled in debug mode.
+
+        Args:
+            message: The error message to log
+        """
+        if self.control_surface._debug:
+            message = f"{message}\n{traceback.format_exc()}"
+        self.log_message(message)
+
     def log_debug(self, message: str) -> None:
         """
         Log a debug message.
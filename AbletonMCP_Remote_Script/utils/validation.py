@@ -90,28 +90,42 @@ def validate_note_data(note: dict[str, Any]) -> bool:
     Raises:
         ValueError: If note data is invalid
     """
-    required_fields = ["pitch", "start_time", "duration"]
-    for field in required_fields:
-        if field not in note:
-            raise ValueError(f"Note data missing required field: {field}")
+    # Same checks, one dictionary lookup per field
+    convert_note_data(note)
+    return True
 
-    # Validate pitch range
-    pitch = note.get("pitch", 60)
-    if not (0 <= pitch <= 127):
-        raise ValueError(f"MIDI pitch must be between 0 and 127, got {pitch}")
 
-    # Validate velocity range
+def convert_note_data(note: dict[str, Any]) -> tuple[Any, Any, Any, Any, Any]:
+    """
+    Validate note data and convert it to Live's note tuple in one pass.
+
+    Reads each field only once, so large note batches avoid repeated
+    dictionary lookups; validate_note_data runs the same checks.
+
+    Args:
+        note: Dictionary containing note data
+
+    Returns:
+        tuple: (pitch, start_time, duration, velocity, mute)
+
+    Raises:
+        ValueError: If note data is invalid
+    """
+    try:
+        pitch = note["pitch"]
+        start_time = note["start_time"]
+        duration = note["duration"]
+    except KeyError as e:
+        raise ValueError(f"Note data missing required field: {e.args[0]}") from None
     velocity = note.get("velocity", 100)
+
+    if not (0 <= pitch <= 127):
+        raise ValueError(f"MIDI pitch must be between 0 and 127, got {pitch}")
     if not (0 <= velocity <= 127):
         raise ValueError(f"MIDI velocity must be between 0 and 127, got {velocity}")
-
-    # Validate timing values
-    start_time = note.get("start_time", 0.0)
     if start_time < 0:
         raise ValueError(f"Start time must be non-negative, got {start_time}")
-
-    duration = note.get("duration", 0.25)
     if duration <= 0:
         raise ValueError(f"Duration must be positive, got {duration}")
 
-    return True
+    return (pitch, start_time, duration, velocity, note.get("mute", False))
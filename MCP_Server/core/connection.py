@@ -2,13 +2,80 @@
 
 from dataclasses import dataclass
 import json
+import os
+from pathlib import Path
 import socket
+import stat
+import struct
+import tempfile
+import time
 from typing import Any, Dict
 
 from ..utils.logging import get_logger
+from ..utils.serialization import json_dumps, json_loads
 
 logger = get_logger("AbletonMCPServer")
 
+# Socket tuning for the localhost connection to the Remote Script
+SOCKET_BUFFER_SIZE = 256 * 1024
+RECV_BUFFER_SIZE = 64 * 1024
+
+# Every message is prefixed with its payload length as a 4-byte big-endian
+# integer, matching the Remote Script's framing
+FRAME_HEADER = struct.Struct("!I")
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+# A frame without payload is a ping, which the Remote Script echoes back
+EMPTY_FRAME = FRAME_HEADER.pack(0)
+
+
+def _default_unix_path() -> str | None:
+    """Per-user path of the Remote Script's Unix domain socket, matching the Remote Script's own"""
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return None
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    directory = Path(runtime_dir) if runtime_dir else Path(tempfile.gettempdir()) / f"ableton-mcp-{os.getuid()}"
+    return str(directory / "ableton-mcp.sock")
+
+
+def _is_own_socket(path: str) -> bool:
+    """Check that path is a socket owned by the current user, so another user can't stand in for Live"""
+    try:
+        info = Path(path).stat()
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+# Unix domain socket the Remote Script listens on besides its TCP port
+DEFAULT_UNIX_PATH = _default_unix_path()
+
+# Commands that change Live's state
+_MODIFYING_COMMANDS = frozenset(
+    {
+        "create_midi_track",
+        "create_audio_track",
+        "set_track_name",
+        "create_clip",
+        "add_notes_to_clip",
+        "set_clip_name",
+        "set_tempo",
+        "fire_clip",
+        "stop_clip",
+        "set_device_parameter",
+        "start_playback",
+        "stop_playback",
+        "load_instrument_or_effect",
+        "load_drum_kit",
+    }
+)
+
+# Response timeout, by whether the command changes Live's state
+_TIMEOUTS = {True: 15.0, False: 10.0}
+
+# A connection that exchanged a message this recently (in seconds) is
+# reused without pinging it first
+IDLE_PING_INTERVAL = 5.0
+
 
 @dataclass
 class AbletonConnection:
@@ -17,19 +84,44 @@ class AbletonConnection:
     host: str
     port: int
     sock: socket.socket = None
+    unix_path: str | None = DEFAULT_UNIX_PATH
+    # time.monotonic() of the last successful exchange with the Remote Script
+    last_used: float = 0.0
 
     def connect(self) -> bool:
         """Connect to the Ableton Remote Script socket server"""
         if self.sock:
             return True
 
+        # Prefer the Unix domain socket when Live is on this machine
+        if self.unix_path and _is_own_socket(self.unix_path):
+            try:
+                self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.sock.connect(self.unix_path)
+                logger.info("Connected to Ableton at %s", self.unix_path)
+                return True
+            except OSError as e:
+                logger.warning("Could not connect to %s, falling back to TCP: %s", self.unix_path, e)
+                self.sock.close()
+                self.sock = None
+
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Commands are small request/reply messages: don't let Nagle hold
+            # them back waiting for the previous reply's ACK
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # The connection is kept open between commands; let the OS notice
+            # if Live went away in the meantime
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Large buffers (set before connecting so the window scale is
+            # negotiated) keep big browser or note payloads to few syscalls
+            for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                self.sock.setsockopt(socket.SOL_SOCKET, option, SOCKET_BUFFER_SIZE)
             self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Ableton at {self.host}:{self.port}")
+            logger.info("Connected to Ableton at %s:%s", self.host, self.port)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to Ableton: {str(e)}")
+            logger.error("Failed to connect to Ableton: %s", e)
             self.sock = None
             return False
 
@@ -39,137 +131,119 @@ class AbletonConnection:
             try:
                 self.sock.close()
             except Exception as e:
-                logger.error(f"Error disconnecting from Ableton: {str(e)}")
+                logger.error("Error disconnecting from Ableton: %s", e)
             finally:
                 self.sock = None
 
-    def receive_full_response(self, sock: socket.socket, buffer_size: int = 8192) -> bytes:
-        """Receive the complete response, potentially in multiple chunks"""
-        chunks = []
-        sock.settimeout(15.0)  # Increased timeout for operations that might take longer
-
+    def ping(self, timeout: float = _TIMEOUTS[False]) -> bool:
+        """Check that the Remote Script still answers, without sending a command"""
+        if not self.sock:
+            return False
         try:
-            while True:
-                try:
-                    chunk = sock.recv(buffer_size)
-                    if not chunk:
-                        if not chunks:
-                            raise Exception("Connection closed before receiving any data")
-                        break
-
-                    chunks.append(chunk)
-
-                    # Check if we've received a complete JSON object
-                    try:
-                        data = b"".join(chunks)
-                        json.loads(data.decode("utf-8"))
-                        logger.info(f"Received complete response ({len(data)} bytes)")
-                        return data
-                    except json.JSONDecodeError:
-                        # Incomplete JSON, continue receiving
-                        continue
-                except TimeoutError:
-                    logger.warning("Socket timeout during chunked receive")
-                    break
-                except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-                    logger.error(f"Socket connection error during receive: {str(e)}")
-                    raise
-        except Exception as e:
-            logger.error(f"Error during receive: {str(e)}")
-            raise
+            self.sock.settimeout(timeout)
+            self.sock.sendall(EMPTY_FRAME)
+            if self._recv_exact(self.sock, FRAME_HEADER.size, FRAME_HEADER.size) != EMPTY_FRAME:
+                return False
+            self.last_used = time.monotonic()
+            return True
+        except OSError as e:
+            logger.warning("Ping to Ableton failed: %s", e)
+            return False
 
-        # If we get here, we either timed out or broke out of the loop
-        if chunks:
-            data = b"".join(chunks)
-            logger.info(f"Returning data after receive completion ({len(data)} bytes)")
-            try:
-                json.loads(data.decode("utf-8"))
-                return data
-            except json.JSONDecodeError:
-                raise Exception("Incomplete JSON response received")
-        else:
-            raise Exception("No data received")
+    def receive_full_response(self, sock: socket.socket, buffer_size: int = RECV_BUFFER_SIZE) -> bytes | bytearray:
+        """Receive one complete length-prefixed response, within the socket's current timeout"""
+        (length,) = FRAME_HEADER.unpack(self._recv_exact(sock, FRAME_HEADER.size, buffer_size))
+        if length > MAX_FRAME_SIZE:
+            # The rest of the stream can't be resynchronized
+            raise ConnectionError(f"Response of {length} bytes exceeds the {MAX_FRAME_SIZE} byte limit")
+        data = self._recv_exact(sock, length, buffer_size)
+        logger.info("Received complete response (%s bytes)", length)
+        return data
+
+    def _recv_exact(self, sock: socket.socket, size: int, buffer_size: int) -> bytearray:
+        """Receive exactly size bytes straight into one preallocated buffer"""
+        data = bytearray(size)
+        view = memoryview(data)
+        received = 0
+        while received < size:
+            count = sock.recv_into(view[received:], min(size - received, buffer_size))
+            if not count:
+                raise ConnectionError("Connection closed before the full response was received")
+            received += count
+        return data
 
     def send_command(self, command_type: str, params: dict[str, Any] = None) -> dict[str, Any]:
         """Send a command to Ableton and return the response"""
+        return self._send(command_type, params, command_type in _MODIFYING_COMMANDS)
+
+    def send_commands(self, commands: list[dict[str, Any]], continue_on_error: bool = True) -> list[dict[str, Any]]:
+        """
+        Send several commands to Ableton in one round trip.
+
+        Parameters:
+        - commands: Commands to run in order, each with a "type" and optional "params"
+        - continue_on_error: Whether to run the remaining commands after one fails
+
+        Returns a list with one response per command that was run, each with
+        a "status" and either a "result" or an error "message".
+        """
+        is_modifying_command = any(command.get("type") in _MODIFYING_COMMANDS for command in commands)
+        params = {"ops": commands, "continue_on_error": continue_on_error}
+        return self._send("batch", params, is_modifying_command)
+
+    def _send(self, command_type: str, params: dict[str, Any] | None, is_modifying_command: bool) -> Any:
+        """Send one command envelope to Ableton and return its result"""
         if not self.sock and not self.connect():
             raise ConnectionError("Not connected to Ableton")
 
         command = {"type": command_type, "params": params or {}}
 
-        # Check if this is a state-modifying command
-        is_modifying_command = command_type in [
-            "create_midi_track",
-            "create_audio_track",
-            "set_track_name",
-            "create_clip",
-            "add_notes_to_clip",
-            "set_clip_name",
-            "set_tempo",
-            "fire_clip",
-            "stop_clip",
-            "set_device_parameter",
-            "start_playback",
-            "stop_playback",
-            "load_instrument_or_effect",
-        ]
-
         try:
-            logger.info(f"Sending command: {command_type} with params: {params}")
+            logger.info("Sending command: %s with params: %s", command_type, params)
 
             # Send the command
-            self.sock.sendall(json.dumps(command).encode("utf-8"))
+            payload = json_dumps(command)
+            self.sock.sendall(FRAME_HEADER.pack(len(payload)) + payload)
             logger.info("Command sent, waiting for response...")
 
-            # For state-modifying commands, add a small delay to give Ableton time to process
-            if is_modifying_command:
-                import time
-
-                time.sleep(0.1)  # 100ms delay
-
             # Set timeout based on command type
-            timeout = 15.0 if is_modifying_command else 10.0
-            self.sock.settimeout(timeout)
+            self.sock.settimeout(_TIMEOUTS[is_modifying_command])
 
             # Receive the response
             response_data = self.receive_full_response(self.sock)
-            logger.info(f"Received {len(response_data)} bytes of data")
+            logger.info("Received %s bytes of data", len(response_data))
 
             # Parse the response
-            response = json.loads(response_data.decode("utf-8"))
-            logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
-
-            if response.get("status") == "error":
-                logger.error(f"Ableton error: {response.get('message')}")
-                raise Exception(response.get("message", "Unknown error from Ableton"))
-
-            # For state-modifying commands, add another small delay after receiving response
-            if is_modifying_command:
-                import time
-
-                time.sleep(0.1)  # 100ms delay
-
-            return response.get("result", {})
+            response = json_loads(response_data)
+            self.last_used = time.monotonic()
+            logger.info("Response parsed, status: %s", response.get("status", "unknown"))
         except TimeoutError:
             logger.error("Socket timeout while waiting for response from Ableton")
-            self.sock = None
+            self.disconnect()
             raise Exception("Timeout waiting for Ableton response")
         except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-            logger.error(f"Socket connection error: {str(e)}")
-            self.sock = None
+            logger.error("Socket connection error: %s", e)
+            self.disconnect()
             raise Exception(f"Connection to Ableton lost: {str(e)}")
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON response from Ableton: {str(e)}")
+            # The whole frame was read, so the connection is still usable
+            logger.error("Invalid JSON response from Ableton: %s", e)
             if "response_data" in locals() and response_data:
                 raw_data = response_data[:200]
-                logger.error(f"Raw response (first 200 bytes): {raw_data!r}")
-            self.sock = None
+                logger.error("Raw response (first 200 bytes): %r", raw_data)
             raise Exception(f"Invalid response from Ableton: {str(e)}")
         except Exception as e:
-            logger.error(f"Error communicating with Ableton: {str(e)}")
-            self.sock = None
+            logger.error("Error communicating with Ableton: %s", e)
+            self.disconnect()
             raise Exception(f"Communication error with Ableton: {str(e)}")
 
+        # An error reported by the Remote Script leaves the connection intact
+        if response.get("status") == "error":
+            logger.error("Ableton error: %s", response.get("message"))
+            raise Exception(response.get("message", "Unknown error from Ableton"))
+
+        return response.get("result", {})
+
 
 # Global connection for resources
 _ableton_connection = None
@@ -180,20 +254,20 @@ def get_ableton_connection() -> AbletonConnection:
     global _ableton_connection
 
     if _ableton_connection is not None:
-        try:
-            # Test the connection with a simple ping
-            # We'll try to send an empty message, which should fail if the connection is dead
-            # but won't affect Ableton if it's alive
-            _ableton_connection.sock.settimeout(1.0)
-            _ableton_connection.sock.sendall(b"")
+        # Failed exchanges drop the socket, so a connection that still has
+        # one and was used recently is good to go. Otherwise an empty frame
+        # round trip catches half-open connections, which an empty send
+        # would not.
+        if _ableton_connection.sock and time.monotonic() - _ableton_connection.last_used < IDLE_PING_INTERVAL:
             return _ableton_connection
-        except Exception as e:
-            logger.warning(f"Existing connection is no longer valid: {str(e)}")
-            try:
-                _ableton_connection.disconnect()
-            except:
-                pass
-            _ableton_connection = None
+        if _ableton_connection.ping():
+            return _ableton_connection
+        logger.warning("Existing connection is no longer valid")
+        try:
+            _ableton_connection.disconnect()
+        except:
+            pass
+        _ableton_connection = None
 
     # Connection doesn't exist or is invalid, create a new one
     if _ableton_connection is None:
@@ -201,34 +275,29 @@ def get_ableton_connection() -> AbletonConnection:
         max_attempts = 3
         for attempt in range(1, max_attempts + 1):
             try:
-                logger.info(f"Connecting to Ableton (attempt {attempt}/{max_attempts})...")
+                logger.info("Connecting to Ableton (attempt %s/%s)...", attempt, max_attempts)
                 _ableton_connection = AbletonConnection(host="localhost", port=9877)
                 if _ableton_connection.connect():
                     logger.info("Created new persistent connection to Ableton")
 
-                    # Validate connection with a simple command
-                    try:
-                        # Get session info as a test
-                        _ableton_connection.send_command("get_session_info")
+                    # Validate the connection with a ping, which doesn't touch Live
+                    if _ableton_connection.ping():
                         logger.info("Connection validated successfully")
                         return _ableton_connection
-                    except Exception as e:
-                        logger.error(f"Connection validation failed: {str(e)}")
-                        _ableton_connection.disconnect()
-                        _ableton_connection = None
-                        # Continue to next attempt
+                    logger.error("Connection validation failed")
+                    _ableton_connection.disconnect()
+                    _ableton_connection = None
+                    # Continue to next attempt
                 else:
                     _ableton_connection = None
             except Exception as e:
-                logger.error(f"Connection attempt {attempt} failed: {str(e)}")
+                logger.error("Connection attempt %s failed: %s", attempt, e)
                 if _ableton_connection:
                     _ableton_connection.disconnect()
                     _ableton_connection = None
 
             # Wait before trying again, but only if we have more attempts left
             if attempt < max_attempts:
-                import time
-
                 time.sleep(1.0)
 
         # If we get here, all connection attempts failed
@@ -34,11 +34,25 @@ class CommandType(Enum):
     STOP_PLAYBACK = "stop_playback"
     LOAD_INSTRUMENT_OR_EFFECT = "load_instrument_or_effect"
     LOAD_BROWSER_ITEM = "load_browser_item"
+    LOAD_DRUM_KIT = "load_drum_kit"
     GET_BROWSER_TREE = "get_browser_tree"
     GET_BROWSER_ITEMS_AT_PATH = "get_browser_items_at_path"
 
 
-@dataclass
+# Command type value -> member, so requests are resolved with a dict lookup
+_COMMAND_TYPES = {command_type.value: command_type for command_type in CommandType}
+
+
+def _safe_getattr(obj: Any, name: str, default: Any = None) -> Any:
+    """Read an attribute, returning default if it is missing or reading it fails."""
+    try:
+        return getattr(obj, name, default)
+    except Exception:
+        # Live raises on proxies whose underlying object was deleted
+        return default
+
+
+@dataclass(slots=True)
 class Note:
     """MIDI note data model."""
 
@@ -55,16 +69,18 @@ class Note:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Note":
         """Create Note from dictionary."""
+        # Positional arguments in field order: this runs once per note
+        get = data.get
         return cls(
-            pitch=data.get("pitch", 60),
-            start_time=data.get("start_time", 0.0),
-            duration=data.get("duration", 0.25),
-            velocity=data.get("velocity", 100),
-            mute=data.get("mute", False),
+            get("pitch", 60),
+            get("start_time", 0.0),
+            get("duration", 0.25),
+            get("velocity", 100),
+            get("mute", False),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipInfo:
     """Clip information data model."""
 
@@ -77,15 +93,10 @@ class ClipInfo:
     @classmethod
     def from_ableton_clip(cls, clip) -> "ClipInfo":
         """Create ClipInfo from Ableton clip object."""
-        return cls(
-            name=clip.name,
-            length=clip.length,
-            is_playing=clip.is_playing,
-            is_recording=clip.is_recording,
-        )
+        return cls(clip.name, clip.length, clip.is_playing, clip.is_recording)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     """Device information data model."""
 
@@ -97,24 +108,25 @@ class DeviceInfo:
     @classmethod
     def from_ableton_device(cls, device, index: int) -> "DeviceInfo":
         """Create DeviceInfo from Ableton device object."""
-        device_type = DeviceType.UNKNOWN
-
-        # Simple heuristic to determine device type
-        try:
-            if hasattr(device, "can_have_drum_pads") and device.can_have_drum_pads:
-                device_type = DeviceType.DRUM_MACHINE
-            elif hasattr(device, "can_have_chains") and device.can_have_chains:
-                device_type = DeviceType.RACK
-            elif hasattr(device, "class_display_name"):
-                class_name_lower = device.class_display_name.lower()
-                if "instrument" in class_name_lower:
+        # Simple heuristic to determine device type. Each probe falls back to
+        # its default if the attribute is missing or the device proxy is
+        # dead, and each name is lowercased only when it is needed.
+        if _safe_getattr(device, "can_have_drum_pads", False):
+            device_type = DeviceType.DRUM_MACHINE
+        elif _safe_getattr(device, "can_have_chains", False):
+            device_type = DeviceType.RACK
+        else:
+            device_type = DeviceType.UNKNOWN
+            class_display_name = _safe_getattr(device, "class_display_name", None)
+            if class_display_name:
+                if "instrument" in class_display_name.lower():
                     device_type = DeviceType.INSTRUMENT
-                elif "audio_effect" in device.class_name.lower():
-                    device_type = DeviceType.AUDIO_EFFECT
-                elif "midi_effect" in device.class_name.lower():
-                    device_type = DeviceType.MIDI_EFFECT
-        except Exception:
-            pass
+                else:
+                    class_name_lower = _safe_getattr(device, "class_name", "").lower()
+                    if "audio_effect" in class_name_lower:
+                        device_type = DeviceType.AUDIO_EFFECT
+                    elif "midi_effect" in class_name_lower:
+                        device_type = DeviceType.MIDI_EFFECT
 
         return cls(
             index=index,
@@ -124,7 +136,7 @@ class DeviceInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipSlotInfo:
     """Clip slot information data model."""
 
@@ -133,7 +145,7 @@ class ClipSlotInfo:
     clip: ClipInfo | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackInfo:
     """Track information data model."""
 
@@ -156,7 +168,7 @@ class TrackInfo:
             self.devices = []
 
 
-@dataclass
+@dataclass(slots=True)
 class MasterTrackInfo:
     """Master track information data model."""
 
@@ -165,7 +177,7 @@ class MasterTrackInfo:
     panning: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Session information data model."""
 
@@ -192,7 +204,7 @@ class SessionInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowserItem:
     """Browser item data model."""
 
@@ -211,16 +223,17 @@ class BrowserItem:
     @classmethod
     def from_ableton_item(cls, item) -> "BrowserItem":
         """Create BrowserItem from Ableton browser item."""
+        # Read each attribute once, with getattr defaults instead of hasattr
         return cls(
-            name=item.name if hasattr(item, "name") else "Unknown",
-            uri=item.uri if hasattr(item, "uri") else None,
-            is_folder=hasattr(item, "children") and bool(item.children),
-            is_device=hasattr(item, "is_device") and item.is_device,
-            is_loadable=hasattr(item, "is_loadable") and item.is_loadable,
+            name=getattr(item, "name", "Unknown"),
+            uri=getattr(item, "uri", None),
+            is_folder=bool(getattr(item, "children", None)),
+            is_device=bool(getattr(item, "is_device", False)),
+            is_loadable=bool(getattr(item, "is_loadable", False)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandRequest:
     """Command request data model."""
 
@@ -239,15 +252,14 @@ class CommandRequest:
     def from_dict(cls, data: dict[str, Any]) -> "CommandRequest":
         """Create CommandRequest from dictionary."""
         command_type_str = data.get("type", "")
-        try:
-            command_type = CommandType(command_type_str)
-        except ValueError:
+        command_type = _COMMAND_TYPES.get(command_type_str)
+        if command_type is None:
             raise ValueError(f"Unknown command type: {command_type_str}")
 
         return cls(command_type=command_type, params=data.get("params", {}))
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResponse:
     """Command response data model."""
 
@@ -277,8 +289,5 @@ class CommandResponse:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CommandResponse":
         """Create CommandResponse from dictionary."""
-        return cls(
-            status=data.get("status", "unknown"),
-            result=data.get("result"),
-            message=data.get("message"),
-        )
+        get = data.get
+        return cls(get("status", "unknown"), get("result"), get("message"))
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Server configuration data model."""
 
@@ -29,7 +29,7 @@ class ServerConfig:
             raise ValueError(f"Buffer size must be positive, got {self.buffer_size}")
 
 
-@dataclass
+@dataclass(slots=True)
 class LogConfig:
     """Logging configuration data model."""
 
@@ -41,7 +41,7 @@ class LogConfig:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPConfig:
     """MCP Server configuration data model."""
 
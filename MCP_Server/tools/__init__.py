@@ -1,6 +1,13 @@
 """Tools module for Ableton MCP Server."""
 
-from .browser_tools import get_browser_items_at_path, get_browser_tree, load_drum_kit, load_instrument_or_effect
+from .batch_tools import run_batch
+from .browser_tools import (
+    get_browser_items_at_path,
+    get_browser_tree,
+    load_drum_kit,
+    load_instrument_or_effect,
+    refresh_browser,
+)
 from .clip_tools import add_notes_to_clip, create_clip, fire_clip, set_clip_name, stop_clip
 from .playback_tools import start_playback, stop_playback
 from .session_tools import create_midi_track, get_session_info, get_track_info, set_tempo, set_track_name
@@ -26,4 +33,7 @@ __all__ = [
     "get_browser_tree",
     "get_browser_items_at_path",
     "load_drum_kit",
+    "refresh_browser",
+    # Batch tools
+    "run_batch",
 ]
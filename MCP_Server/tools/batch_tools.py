@@ -0,0 +1,23 @@
+"""Batch command tools for Ableton MCP."""
+
+from typing import Any
+
+from mcp.server.fastmcp import Context
+
+from ..core import get_ableton_connection
+from ..utils.error_handling import handle_tool_errors
+from ..utils.serialization import to_pretty_json
+
+
+@handle_tool_errors("running batch")
+def run_batch(ctx: Context, commands: list[dict[str, Any]], continue_on_error: bool = True) -> str:
+    """
+    Run several Ableton commands in a single round trip.
+
+    Parameters:
+    - commands: Commands to run in order, each with a "type" (e.g. "create_clip") and optional "params"
+    - continue_on_error: Whether to keep going after a command fails (default True)
+    """
+    ableton = get_ableton_connection()
+    results = ableton.send_commands(commands, continue_on_error)
+    return to_pretty_json(results)
@@ -1,16 +1,62 @@
 """Browser and instrument loading tools for Ableton MCP."""
 
-import json
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
 from ..core import get_ableton_connection
+from ..utils.error_handling import handle_tool_errors
 from ..utils.logging import get_logger
+from ..utils.serialization import to_pretty_json
 
 logger = get_logger("AbletonMCPServer")
 
-
+# Indentation for each tree level, so formatting a tree doesn't build a new
+# indent string for every node
+_INDENTS = tuple("  " * level for level in range(64))
+
+# Known browser failures as (substrings that must all appear in the error,
+# log label, user message template)
+_BROWSER_ERRORS = (
+    (
+        ("Browser is not available",),
+        "Browser is not available in Ableton",
+        "Error: The Ableton browser is not available. Make sure Ableton Live is fully loaded and try again.",
+    ),
+    (
+        ("Could not access Live application",),
+        "Could not access Live application",
+        "Error: Could not access the Ableton Live application. Make sure Ableton Live is running and the Remote Script is loaded.",
+    ),
+)
+
+# Additional failures for lookups by browser path
+_BROWSER_PATH_ERRORS = _BROWSER_ERRORS + (
+    (
+        ("Unknown or unavailable category",),
+        "Invalid browser category",
+        "Error: {error}. Please check the available categories using get_browser_tree.",
+    ),
+    (
+        ("Path part", "not found"),
+        "Path not found",
+        "Error: {error}. Please check the path and try again.",
+    ),
+)
+
+
+def _browser_error(error: Exception, known_errors: tuple, fallback_label: str) -> str:
+    """Log a browser error and return the message to show the user"""
+    error_msg = str(error)
+    for needles, log_label, message in known_errors:
+        if all(needle in error_msg for needle in needles):
+            logger.error("%s: %s", log_label, error_msg)
+            return message.format(error=error_msg)
+    logger.error("%s: %s", fallback_label, error_msg)
+    return f"{fallback_label}: {error_msg}"
+
+
+@handle_tool_errors("loading instrument by URI")
 def load_instrument_or_effect(ctx: Context, track_index: int, uri: str) -> str:
     """
     Load an instrument or effect onto a track using its URI.
@@ -19,43 +65,42 @@ def load_instrument_or_effect(ctx: Context, track_index: int, uri: str) -> str:
     - track_index: The index of the track to load the instrument on
     - uri: The URI of the instrument or effect to load (e.g., 'query:Synths#Instrument%20Rack:Bass:FileId_5116')
     """
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("load_browser_item", {"track_index": track_index, "item_uri": uri})
-
-        # Check if the instrument was loaded successfully
-        if result.get("loaded", False):
-            new_devices = result.get("new_devices", [])
-            if new_devices:
-                return (
-                    f"Loaded instrument with URI '{uri}' on track {track_index}. New devices: {', '.join(new_devices)}"
-                )
-            else:
-                devices = result.get("devices_after", [])
-                return (
-                    f"Loaded instrument with URI '{uri}' on track {track_index}. Devices on track: {', '.join(devices)}"
-                )
+    ableton = get_ableton_connection()
+    result = ableton.send_command("load_browser_item", {"track_index": track_index, "item_uri": uri})
+
+    # Check if the instrument was loaded successfully
+    if result.get("loaded", False):
+        new_devices = result.get("new_devices", [])
+        if new_devices:
+            return (
+                f"Loaded instrument with URI '{uri}' on track {track_index}. New devices: {', '.join(new_devices)}"
+            )
         else:
-            return f"Failed to load instrument with URI '{uri}'"
-    except Exception as e:
-        logger.error(f"Error loading instrument by URI: {str(e)}")
-        return f"Error loading instrument by URI: {str(e)}"
+            devices = result.get("devices_after", [])
+            return (
+                f"Loaded instrument with URI '{uri}' on track {track_index}. Devices on track: {', '.join(devices)}"
+            )
+    else:
+        return f"Failed to load instrument with URI '{uri}'"
 
 
-def get_browser_tree(ctx: Context, category_type: str = "all") -> str:
+def get_browser_tree(ctx: Context, category_type: str = "all", depth: int = 0) -> str:
     """
     Get a hierarchical tree of browser categories from Ableton.
 
     Parameters:
     - category_type: Type of categories to get ('all', 'instruments', 'sounds', 'drums', 'audio_effects', 'midi_effects')
+    - depth: Number of folder levels to include below each category (default 0)
     """
     try:
         ableton = get_ableton_connection()
-        result = ableton.send_command("get_browser_tree", {"category_type": category_type})
+        result = ableton.send_command("get_browser_tree", {"category_type": category_type, "depth": depth})
+
+        categories = result.get("categories") or ()
 
         # Check if we got any categories
-        if "available_categories" in result and len(result.get("categories", [])) == 0:
-            available_cats = result.get("available_categories", [])
+        if not categories and "available_categories" in result:
+            available_cats = result["available_categories"]
             return (
                 f"No categories found for '{category_type}'. "
                 f"Available browser categories: {', '.join(available_cats)}"
@@ -63,46 +108,31 @@ def get_browser_tree(ctx: Context, category_type: str = "all") -> str:
 
         # Format the tree in a more readable way
         total_folders = result.get("total_folders", 0)
-        formatted_output = f"Browser tree for '{category_type}' (showing {total_folders} folders):\n\n"
-
-        def format_tree(item: dict[str, Any], indent: int = 0) -> str:
-            output = ""
-            if item:
-                prefix = "  " * indent
-                name = item.get("name", "Unknown")
+        # Walk the tree with an explicit stack, collecting lines to join once
+        # at the end, so deep trees (see depth) need neither a Python frame
+        # per node nor repeated string concatenation
+        lines = [f"Browser tree for '{category_type}' (showing {total_folders} folders):", ""]
+        for category in categories:
+            stack = [(category, 0)]
+            while stack:
+                item, indent = stack.pop()
+                if not item:
+                    continue
+                prefix = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
+                line = f"{prefix}• {item.get('name', 'Unknown')}"
                 path = item.get("path", "")
-                has_more = item.get("has_more", False)
-
-                # Add this item
-                output += f"{prefix}• {name}"
                 if path:
-                    output += f" (path: {path})"
-                if has_more:
-                    output += " [...]"
-                output += "\n"
-
-                # Add children
-                for child in item.get("children", []):
-                    output += format_tree(child, indent + 1)
-            return output
-
-        # Format each category
-        for category in result.get("categories", []):
-            formatted_output += format_tree(category)
-            formatted_output += "\n"
-
-        return formatted_output
+                    line += f" (path: {path})"
+                if item.get("has_more", False):
+                    line += " [...]"
+                lines.append(line)
+                # Reversed so children come off the stack in order
+                stack.extend((child, indent + 1) for child in reversed(item.get("children", [])))
+            lines.append("")
+
+        return "\n".join(lines) + "\n"
     except Exception as e:
-        error_msg = str(e)
-        if "Browser is not available" in error_msg:
-            logger.error(f"Browser is not available in Ableton: {error_msg}")
-            return "Error: The Ableton browser is not available. Make sure Ableton Live is fully loaded and try again."
-        elif "Could not access Live application" in error_msg:
-            logger.error(f"Could not access Live application: {error_msg}")
-            return "Error: Could not access the Ableton Live application. Make sure Ableton Live is running and the Remote Script is loaded."
-        else:
-            logger.error(f"Error getting browser tree: {error_msg}")
-            return f"Error getting browser tree: {error_msg}"
+        return _browser_error(e, _BROWSER_ERRORS, "Error getting browser tree")
 
 
 def get_browser_items_at_path(ctx: Context, path: str) -> str:
@@ -123,26 +153,25 @@ def get_browser_items_at_path(ctx: Context, path: str) -> str:
             available_cats = result.get("available_categories", [])
             return f"Error: {error}\n" f"Available browser categories: {', '.join(available_cats)}"
 
-        return json.dumps(result, indent=2)
+        return to_pretty_json(result)
     except Exception as e:
-        error_msg = str(e)
-        if "Browser is not available" in error_msg:
-            logger.error(f"Browser is not available in Ableton: {error_msg}")
-            return "Error: The Ableton browser is not available. Make sure Ableton Live is fully loaded and try again."
-        elif "Could not access Live application" in error_msg:
-            logger.error(f"Could not access Live application: {error_msg}")
-            return "Error: Could not access the Ableton Live application. Make sure Ableton Live is running and the Remote Script is loaded."
-        elif "Unknown or unavailable category" in error_msg:
-            logger.error(f"Invalid browser category: {error_msg}")
-            return f"Error: {error_msg}. Please check the available categories using get_browser_tree."
-        elif "Path part" in error_msg and "not found" in error_msg:
-            logger.error(f"Path not found: {error_msg}")
-            return f"Error: {error_msg}. Please check the path and try again."
-        else:
-            logger.error(f"Error getting browser items at path: {error_msg}")
-            return f"Error getting browser items at path: {error_msg}"
+        return _browser_error(e, _BROWSER_PATH_ERRORS, "Error getting browser items at path")
+
 
+@handle_tool_errors("refreshing browser")
+def refresh_browser(ctx: Context) -> str:
+    """
+    Make Ableton re-read its browser on the next lookup.
 
+    Browser trees, folder listings and URI lookups are cached by the Remote
+    Script; call this after installing packs or saving presets so they show up.
+    """
+    ableton = get_ableton_connection()
+    ableton.send_command("invalidate_browser_index")
+    return "Cleared cached browser contents; the next browser lookups will re-read Ableton's browser"
+
+
+@handle_tool_errors("loading drum kit")
 def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str) -> str:
     """
     Load a drum rack and then load a specific drum kit into it.
@@ -152,33 +181,21 @@ def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str)
     - rack_uri: The URI of the drum rack to load (e.g., 'Drums/Drum Rack')
     - kit_path: Path to the drum kit inside the browser (e.g., 'drums/acoustic/kit1')
     """
-    try:
-        ableton = get_ableton_connection()
-
-        # Step 1: Load the drum rack
-        result = ableton.send_command("load_browser_item", {"track_index": track_index, "item_uri": rack_uri})
-
-        if not result.get("loaded", False):
-            return f"Failed to load drum rack with URI '{rack_uri}'"
+    # The Remote Script loads the rack, finds the kit and loads it in one
+    # command, so this costs a single round trip
+    ableton = get_ableton_connection()
+    result = ableton.send_command(
+        "load_drum_kit", {"track_index": track_index, "rack_uri": rack_uri, "kit_path": kit_path}
+    )
 
-        # Step 2: Get the drum kit items at the specified path
-        kit_result = ableton.send_command("get_browser_items_at_path", {"path": kit_path})
+    if not result.get("loaded", False):
+        return f"Failed to load drum rack with URI '{rack_uri}'"
 
-        if "error" in kit_result:
-            return f"Loaded drum rack but failed to find drum kit: {kit_result.get('error')}"
+    if "error" in result:
+        return f"Loaded drum rack but failed to find drum kit: {result.get('error')}"
 
-        # Step 3: Find a loadable drum kit
-        kit_items = kit_result.get("items", [])
-        loadable_kits = [item for item in kit_items if item.get("is_loadable", False)]
+    kit_name = result.get("kit_name")
+    if kit_name is None:
+        return f"Loaded drum rack but no loadable drum kits found at '{kit_path}'"
 
-        if not loadable_kits:
-            return f"Loaded drum rack but no loadable drum kits found at '{kit_path}'"
-
-        # Step 4: Load the first loadable kit
-        kit_uri = loadable_kits[0].get("uri")
-        load_result = ableton.send_command("load_browser_item", {"track_index": track_index, "item_uri": kit_uri})
-
-        return f"Loaded drum rack and kit '{loadable_kits[0].get('name')}' on track {track_index}"
-    except Exception as e:
-        logger.error(f"Error loading drum kit: {str(e)}")
-        return f"Error loading drum kit: {str(e)}"
+    return f"Loaded drum rack and kit '{kit_name}' on track {track_index}"
@@ -3,28 +3,20 @@
 from mcp.server.fastmcp import Context
 
 from ..core import get_ableton_connection
-from ..utils.logging import get_logger
-
-logger = get_logger("AbletonMCPServer")
+from ..utils.error_handling import handle_tool_errors
 
 
+@handle_tool_errors("starting playback")
 def start_playback(ctx: Context) -> str:
     """Start playing the Ableton session."""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("start_playback")
-        return "Started playback"
-    except Exception as e:
-        logger.error(f"Error starting playback: {str(e)}")
-        return f"Error starting playback: {str(e)}"
+    ableton = get_ableton_connection()
+    result = ableton.send_command("start_playback")
+    return "Started playback"
 
 
+@handle_tool_errors("stopping playback")
 def stop_playback(ctx: Context) -> str:
     """Stop playing the Ableton session."""
-    try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("stop_playback")
-        return "Stopped playback"
-    except Exception as e:
-        logger.error(f"Error stopping playback: {str(e)}")
-        return f"Error stopping playback: {str(e)}"
+    ableton = get_ableton_connection()
+    result = ableton.send_command("stop_playback")
+    return "Stopped playback"
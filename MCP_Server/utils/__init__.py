@@ -1,6 +1,8 @@
 """Utility functions for Ableton MCP Server."""
 
+from .error_handling import handle_tool_errors
 from .logging import get_logger, setup_logging
+from .serialization import json_dumps, json_loads, to_pretty_json
 from .validation import (
     validate_clip_index,
     validate_note_data,
@@ -14,7 +16,13 @@ __all__ = [
     "validate_track_index",
     "validate_clip_index",
     "validate_tempo",
+    # Error handling utilities
+    "handle_tool_errors",
     # Logging utilities
     "setup_logging",
     "get_logger",
+    # Serialization utilities
+    "json_dumps",
+    "json_loads",
+    "to_pretty_json",
 ]
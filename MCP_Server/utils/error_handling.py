@@ -0,0 +1,34 @@
+"""Error handling utilities for Ableton MCP tools."""
+
+from collections.abc import Callable
+import functools
+
+from .logging import get_logger
+
+logger = get_logger("AbletonMCPServer")
+
+
+def handle_tool_errors(action: str) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """
+    Report exceptions raised by a tool as an error message instead.
+
+    Args:
+        action: What the tool does, used in the log and the returned message
+            (e.g. "creating clip")
+
+    Returns:
+        Decorator that logs the error and returns "Error <action>: <error>"
+    """
+
+    def decorator(fn: Callable[..., str]) -> Callable[..., str]:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> str:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("Error %s: %s", action, e)
+                return f"Error {action}: {e}"
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,28 @@
+"""JSON serialization utilities for Ableton MCP Server."""
+
+import json
+from typing import Any
+
+# Prefer orjson when it is installed (the "fast" extra): it encodes straight
+# to bytes and decodes large responses considerably faster. Its decode error
+# subclasses json.JSONDecodeError, so error handling is the same either way.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+
+    def to_pretty_json(obj: Any) -> str:
+        """Format data as indented JSON for a tool result."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Encode data as compact UTF-8 JSON."""
+        return json.dumps(obj).encode("utf-8")
+
+    def to_pretty_json(obj: Any) -> str:
+        """Format data as indented JSON for a tool result."""
+        return json.dumps(obj, indent=2)
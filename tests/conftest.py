@@ -0,0 +1,37 @@
+"""Shared test setup."""
+
+import sys
+import types
+
+try:
+    import _Framework
+except ImportError:
+    # The Remote Script builds on Live's _Framework, which only exists inside
+    # Live. A bare ControlSurface is enough to import its modules.
+    class ControlSurface:
+        """Stand-in for Live's ControlSurface base class"""
+
+        def __init__(self, c_instance):
+            self._c_instance = c_instance
+
+        def log_message(self, message):
+            pass
+
+        def show_message(self, message):
+            pass
+
+        def schedule_message(self, delay, callback):
+            pass
+
+        def update_display(self):
+            pass
+
+        def disconnect(self):
+            pass
+
+    framework = types.ModuleType("_Framework")
+    control_surface = types.ModuleType("_Framework.ControlSurface")
+    control_surface.ControlSurface = ControlSurface
+    framework.ControlSurface = control_surface
+    sys.modules["_Framework"] = framework
+    sys.modules["_Framework.ControlSurface"] = control_surface
@@ -0,0 +1,64 @@
+"""Tests for running several commands in one batch on the Remote Script."""
+
+import pytest
+
+from AbletonMCP_Remote_Script.core.main import AbletonMCP
+
+
+def _set_tempo(tempo):
+    if not 20 <= tempo <= 999:
+        raise ValueError(f"Tempo {tempo} out of range")
+    return {"tempo": tempo}
+
+
+@pytest.fixture
+def mcp():
+    # Only the batch runner is exercised, so skip __init__ and its socket server
+    mcp = AbletonMCP.__new__(AbletonMCP)
+    mcp._debug = False
+    mcp._batch_cmds = {"set_tempo": _set_tempo, "ping": dict}
+    mcp.log_message = lambda message: None
+    return mcp
+
+
+def test_continue_on_error_runs_every_command(mcp):
+    ops = [
+        {"type": "set_tempo", "params": {"tempo": 100}},
+        {"type": "set_tempo", "params": {"tempo": 5}},
+        {"type": "ping"},
+    ]
+
+    results = mcp._run_batch(ops, continue_on_error=True)
+
+    assert results == [
+        {"status": "success", "result": {"tempo": 100}},
+        {"status": "error", "message": "Tempo 5 out of range"},
+        {"status": "success", "result": {}},
+    ]
+
+
+def test_stop_on_error_skips_the_remaining_commands(mcp):
+    ops = [
+        {"type": "set_tempo", "params": {"tempo": 5}},
+        {"type": "set_tempo", "params": {"tempo": 100}},
+    ]
+
+    results = mcp._run_batch(ops, continue_on_error=False)
+
+    assert results == [{"status": "error", "message": "Tempo 5 out of range"}]
+
+
+@pytest.mark.parametrize("continue_on_error", [True, False])
+def test_unknown_command_is_an_error(mcp, continue_on_error):
+    ops = [{"type": "delete_everything"}, {"type": "ping"}]
+
+    results = mcp._run_batch(ops, continue_on_error=continue_on_error)
+
+    assert results[0] == {"status": "error", "message": "Unknown command: delete_everything"}
+    assert len(results) == (2 if continue_on_error else 1)
+
+
+def test_missing_params_use_the_defaults(mcp):
+    assert mcp._run_batch([{"type": "set_tempo"}], continue_on_error=False) == [
+        {"status": "success", "result": {"tempo": 120.0}}
+    ]
@@ -0,0 +1,112 @@
+"""Wire protocol tests for the MCP server's connection to the Remote Script."""
+
+import json
+import socket
+import threading
+
+import pytest
+
+from MCP_Server.core.connection import EMPTY_FRAME, FRAME_HEADER, MAX_FRAME_SIZE, AbletonConnection
+
+
+@pytest.fixture
+def pair():
+    sock, peer = socket.socketpair()
+    sock.settimeout(1.0)
+    peer.settimeout(1.0)
+    yield sock, peer
+    sock.close()
+    peer.close()
+
+
+@pytest.fixture
+def connection(pair):
+    return AbletonConnection(host="localhost", port=0, sock=pair[0], unix_path=None)
+
+
+def _frame(payload):
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def test_receive_frame_arriving_in_pieces(pair, connection):
+    sock, peer = pair
+    data = _frame(json.dumps({"status": "success", "result": {"tempo": 120.0}}).encode())
+
+    def send_slowly():
+        for start in range(0, len(data), 5):
+            peer.sendall(data[start : start + 5])
+
+    sender = threading.Thread(target=send_slowly)
+    sender.start()
+    response = connection.receive_full_response(sock, buffer_size=3)
+    sender.join()
+
+    assert json.loads(response) == {"status": "success", "result": {"tempo": 120.0}}
+
+
+def test_receive_back_to_back_frames(pair, connection):
+    sock, peer = pair
+    peer.sendall(_frame(b'{"n": 1}') + _frame(b'{"n": 2}'))
+
+    assert connection.receive_full_response(sock) == b'{"n": 1}'
+    assert connection.receive_full_response(sock) == b'{"n": 2}'
+
+
+def test_receive_empty_frame(pair, connection):
+    sock, peer = pair
+    peer.sendall(EMPTY_FRAME)
+
+    assert connection.receive_full_response(sock) == b""
+
+
+def test_receive_oversized_frame_raises(pair, connection):
+    sock, peer = pair
+    peer.sendall(FRAME_HEADER.pack(MAX_FRAME_SIZE + 1))
+
+    with pytest.raises(ConnectionError, match="exceeds"):
+        connection.receive_full_response(sock)
+
+
+def test_receive_truncated_frame_raises(pair, connection):
+    sock, peer = pair
+    peer.sendall(FRAME_HEADER.pack(10) + b"abc")
+    peer.shutdown(socket.SHUT_WR)
+
+    with pytest.raises(ConnectionError, match="closed"):
+        connection.receive_full_response(sock)
+
+
+def test_ping_sends_and_expects_an_empty_frame(pair, connection):
+    _sock, peer = pair
+    peer.sendall(EMPTY_FRAME)
+
+    assert connection.ping()
+    assert peer.recv(16) == EMPTY_FRAME
+    assert connection.last_used > 0
+
+
+def test_ping_rejects_a_non_empty_reply(pair, connection):
+    _sock, peer = pair
+    peer.sendall(_frame(b"{}"))
+
+    assert not connection.ping()
+
+
+def test_send_command_frames_the_command(pair, connection):
+    _sock, peer = pair
+    peer.sendall(_frame(json.dumps({"status": "success", "result": {"tempo": 99.0}}).encode()))
+
+    assert connection.send_command("set_tempo", {"tempo": 99.0}) == {"tempo": 99.0}
+
+    (length,) = FRAME_HEADER.unpack(peer.recv(FRAME_HEADER.size))
+    assert json.loads(peer.recv(length)) == {"type": "set_tempo", "params": {"tempo": 99.0}}
+
+
+def test_send_command_raises_the_remote_error(pair, connection):
+    _sock, peer = pair
+    peer.sendall(_frame(json.dumps({"status": "error", "message": "Track index out of range"}).encode()))
+
+    with pytest.raises(Exception, match="Track index out of range"):
+        connection.send_command("get_track_info", {"track_index": 9})
+    # An error reported by the Remote Script keeps the connection
+    assert connection.sock is not None
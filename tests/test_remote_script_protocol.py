@@ -0,0 +1,296 @@
+"""Wire protocol tests for the Remote Script's client connections."""
+
+import json
+import selectors
+import socket
+
+import pytest
+
+from AbletonMCP_Remote_Script.core.client import (
+    FRAME_HEADER,
+    MAX_FRAME_SIZE,
+    RECV_BUFFER_SIZE,
+    ClientHandler,
+    _ends_with_brace,
+    _split_json_objects,
+)
+
+
+class _Logger:
+    """Collects log messages"""
+
+    def __init__(self):
+        self.messages = []
+
+    def log_message(self, message):
+        self.messages.append(message)
+
+
+class _Client:
+    """A ClientHandler connection driven by hand over a socket pair"""
+
+    def __init__(self, processor=None):
+        self.commands = []
+        self.replies = []
+        self.writing = []
+        self.server, self.peer = socket.socketpair()
+        self.peer.settimeout(1.0)
+        self.handler = ClientHandler(_Logger(), processor or self._echo)
+        self.handler.set_running(True)
+        # call_soon runs callbacks right away: the test is the selector thread
+        self.on_ready = self.handler.handle_client(self.server, lambda callback: callback(), self.writing.append)
+
+    def _echo(self, command, reply):
+        self.commands.append(command)
+        return {"status": "success", "result": command}
+
+    def feed(self, data):
+        """Send data from the peer and let the connection read it"""
+        self.peer.sendall(data)
+        return self.on_ready(selectors.EVENT_READ)
+
+    def recv_exact(self, size):
+        data = b""
+        while len(data) < size:
+            chunk = self.peer.recv(size - len(data))
+            assert chunk, "connection closed"
+            data += chunk
+        return data
+
+    def read_frame(self):
+        (length,) = FRAME_HEADER.unpack(self.recv_exact(FRAME_HEADER.size))
+        return self.recv_exact(length)
+
+    def read_unframed(self, count):
+        """Read count bare JSON replies"""
+        decoder = json.JSONDecoder()
+        text, objects = "", []
+        while len(objects) < count:
+            text += self.peer.recv(65536).decode()
+            text = text.lstrip()
+            while text:
+                try:
+                    obj, end = decoder.raw_decode(text)
+                except ValueError:
+                    break
+                objects.append(obj)
+                text = text[end:].lstrip()
+        return objects
+
+    def nothing_sent(self):
+        self.peer.setblocking(False)
+        try:
+            self.peer.recv(1)
+        except BlockingIOError:
+            return True
+        finally:
+            self.peer.settimeout(1.0)
+        return False
+
+    def close(self):
+        self.server.close()
+        self.peer.close()
+
+
+def _frame(payload):
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def _command(command_type, **params):
+    return json.dumps({"type": command_type, "params": params}).encode()
+
+
+@pytest.fixture
+def client():
+    client = _Client()
+    yield client
+    client.close()
+
+
+def test_frame_split_across_reads(client):
+    data = _frame(_command("get_track_info", track_index=1))
+
+    assert client.feed(data[:2])
+    assert client.feed(data[2:10])
+    assert client.nothing_sent()
+
+    assert client.feed(data[10:])
+    reply = json.loads(client.read_frame())
+    assert reply == {"status": "success", "result": {"type": "get_track_info", "params": {"track_index": 1}}}
+
+
+def test_back_to_back_frames_answered_in_order(client):
+    assert client.feed(_frame(_command("first")) + _frame(_command("second")) + _frame(_command("third")))
+
+    types = [json.loads(client.read_frame())["result"]["type"] for _ in range(3)]
+    assert types == ["first", "second", "third"]
+
+
+def test_empty_frame_is_a_ping(client):
+    assert client.feed(FRAME_HEADER.pack(0))
+
+    assert client.read_frame() == b""
+    assert client.commands == []
+
+
+def test_frame_larger_than_receive_buffer(client):
+    name = "x" * (3 * RECV_BUFFER_SIZE)
+    data = _frame(_command("set_track_name", name=name))
+
+    for start in range(0, len(data), 32 * 1024):
+        assert client.feed(data[start : start + 32 * 1024])
+
+    reply = json.loads(client.read_frame())
+    assert reply["result"]["params"]["name"] == name
+
+
+def test_oversized_frame_closes_connection(client):
+    assert not client.feed(FRAME_HEADER.pack(MAX_FRAME_SIZE + 1))
+
+    reply = json.loads(client.read_frame())
+    assert reply["status"] == "error"
+    assert "exceeds limit" in reply["message"]
+
+
+def test_invalid_json_frame_gets_error_reply(client):
+    assert client.feed(_frame(b"{not json"))
+
+    reply = json.loads(client.read_frame())
+    assert reply["status"] == "error"
+    assert reply["message"].startswith("Invalid JSON")
+
+
+def test_legacy_objects_sent_together_are_split(client):
+    assert client.feed(b'{"type": "first"} {"type": "second"}\n')
+
+    assert client.commands == [{"type": "first"}, {"type": "second"}]
+    assert [reply["result"]["type"] for reply in client.read_unframed(2)] == ["first", "second"]
+
+
+def test_legacy_command_split_across_reads(client):
+    assert client.feed(b'{"type": "get_track_info", "params": {')
+    assert client.commands == []
+
+    assert client.feed(b'"track_index": 2}}')
+    assert client.commands == [{"type": "get_track_info", "params": {"track_index": 2}}]
+
+
+def test_legacy_waits_for_a_closing_brace(client):
+    assert client.feed(b'{"type": "first"}{"type": "sec')
+    assert client.commands == []
+
+    assert client.feed(b'ond"}')
+    assert client.commands == [{"type": "first"}, {"type": "second"}]
+
+
+def test_legacy_incomplete_trailing_object_is_kept(client):
+    # Ends with a brace, but the second object is still missing one
+    assert client.feed(b'{"type": "first"}{"type": "second", "params": {}')
+    assert client.commands == [{"type": "first"}]
+
+    assert client.feed(b"}")
+    assert client.commands == [{"type": "first"}, {"type": "second", "params": {}}]
+
+
+def test_main_thread_reply_keeps_request_order():
+    replies = []
+
+    def processor(command, reply):
+        if command["type"] == "slow":
+            replies.append(reply)
+            return None
+        return {"status": "success", "result": command}
+
+    client = _Client(processor)
+    try:
+        assert client.feed(_frame(_command("slow")) + FRAME_HEADER.pack(0) + _frame(_command("fast")))
+        # The ping and the fast command wait behind the outstanding reply
+        assert client.nothing_sent()
+
+        replies[0]({"status": "success", "result": "done"})
+        assert json.loads(client.read_frame())["result"] == "done"
+        assert client.read_frame() == b""
+        assert json.loads(client.read_frame())["result"]["type"] == "fast"
+    finally:
+        client.close()
+
+
+def test_unencodable_reply_becomes_error():
+    client = _Client(lambda command, reply: {"status": "success", "result": object()})
+    try:
+        assert client.feed(_frame(_command("broken")) + FRAME_HEADER.pack(0))
+
+        assert json.loads(client.read_frame())["status"] == "error"
+        assert client.read_frame() == b""
+    finally:
+        client.close()
+
+
+def test_reply_larger_than_socket_buffer_is_flushed_when_writable():
+    payload = "y" * (8 * 1024 * 1024)
+    client = _Client(lambda command, reply: {"status": "success", "result": payload})
+    try:
+        assert client.feed(_frame(_command("big")) + FRAME_HEADER.pack(0))
+        assert client.writing == [True]
+
+        received = b""
+        while client.writing[-1]:
+            received += client.peer.recv(1024 * 1024)
+            assert client.on_ready(selectors.EVENT_WRITE)
+        assert client.writing == [True, False]
+
+        client.peer.setblocking(True)
+        while len(received) < FRAME_HEADER.size:
+            received += client.peer.recv(1024 * 1024)
+        (length,) = FRAME_HEADER.unpack_from(received)
+        end = FRAME_HEADER.size + length
+        while len(received) < end + FRAME_HEADER.size:
+            received += client.peer.recv(1024 * 1024)
+
+        assert json.loads(received[FRAME_HEADER.size : end])["result"] == payload
+        # The ping's reply follows the big one
+        assert received[end:] == FRAME_HEADER.pack(0)
+    finally:
+        client.close()
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (b'{"type": "ping"}', True),
+        (b'{"type": "ping"} \r\n', True),
+        (b'{"type": "ping"', False),
+        (b"   ", False),
+        (b"", False),
+    ],
+)
+def test_ends_with_brace(data, expected):
+    assert _ends_with_brace(bytearray(data), len(data)) is expected
+
+
+def test_ends_with_brace_only_looks_at_valid_bytes():
+    buffer = bytearray(b'{"a": 1}{"b"')
+    assert _ends_with_brace(buffer, 8)
+    assert not _ends_with_brace(buffer, len(buffer))
+
+
+def test_split_json_objects():
+    data = bytearray(b'{"a": 1} {"b": 2}\n{"c"')
+
+    objects, consumed = _split_json_objects(data)
+
+    assert objects == [{"a": 1}, {"b": 2}]
+    assert data[consumed:] == b'\n{"c"'
+
+
+def test_split_json_objects_counts_bytes_not_characters():
+    first = '{"name": "Café"}'.encode()
+
+    objects, consumed = _split_json_objects(bytearray(first + b'{"name"'))
+
+    assert objects == [{"name": "Café"}]
+    assert consumed == len(first)
+
+
+def test_split_json_objects_rejects_invalid_utf8():
+    assert _split_json_objects(bytearray(b'{"a": "\xff"}')) == ([], 0)